@@ -1,81 +1,165 @@
+from dataclasses import dataclass
 from typing import List, Dict
 
+import numpy as np
 
-def compute_net_cash_flow(inflows: List[float], outflows: List[float]) -> List[float]:
+
+@dataclass(slots=True)
+class CashFlowStatement:
+    """
+    Per-period cash flow statement arrays produced by `generate_cash_flow_statement`.
+    
+    Attributes:
+        net (np.ndarray): Net cash flow per period.
+        cumulative (np.ndarray): Cumulative cash flow.
+        discounted (np.ndarray): Discounted cash flow per period.
+        cumulative_discounted (np.ndarray): Cumulative discounted cash flow.
+    """
+    net: np.ndarray
+    cumulative: np.ndarray
+    discounted: np.ndarray
+    cumulative_discounted: np.ndarray
+
+    def to_dict(self) -> Dict[str, List[float]]:
+        """
+        Convert the statement to plain lists for JSON serialization at the API boundary.
+        
+        Returns:
+            Dict[str, List[float]]: A dictionary with keys:
+                - "net_cash_flow"
+                - "cumulative_cash_flow"
+                - "discounted_cash_flow"
+                - "cumulative_discounted_cash_flow"
+        """
+        return {
+            "net_cash_flow": self.net.tolist(),
+            "cumulative_cash_flow": self.cumulative.tolist(),
+            "discounted_cash_flow": self.discounted.tolist(),
+            "cumulative_discounted_cash_flow": self.cumulative_discounted.tolist(),
+        }
+
+
+def compute_net_cash_flow(inflows: List[float], outflows: List[float]) -> np.ndarray:
     """
     Compute the net cash flow for each period by subtracting outflows from inflows.
     
     Args:
-        inflows (List[float]): A list of cash inflows per period.
-        outflows (List[float]): A list of cash outflows per period.
+        inflows (List[float]): A list (or array) of cash inflows per period.
+        outflows (List[float]): A list (or array) of cash outflows per period.
         
     Returns:
-        List[float]: A list of net cash flows for each period.
+        np.ndarray: An array of net cash flows for each period.
     
     Raises:
         ValueError: If the lengths of the inflows and outflows lists do not match.
     """
-    if len(inflows) != len(outflows):
+    inflows_arr = np.asarray(inflows, dtype=np.float64)
+    outflows_arr = np.asarray(outflows, dtype=np.float64)
+    if inflows_arr.shape != outflows_arr.shape:
         raise ValueError("The number of inflows must equal the number of outflows.")
-    return [inflow - outflow for inflow, outflow in zip(inflows, outflows)]
+    return np.subtract(inflows_arr, outflows_arr)
 
 
-def compute_cumulative_flow(net_flows: List[float]) -> List[float]:
+def compute_cumulative_flow(net_flows: List[float]) -> np.ndarray:
     """
     Calculate the cumulative cash flow over the given periods.
     
     Args:
-        net_flows (List[float]): A list of net cash flows for each period.
+        net_flows (List[float]): A list (or array) of net cash flows for each period.
+        
+    Returns:
+        np.ndarray: A cumulative cash flow array.
+    """
+    return np.cumsum(np.asarray(net_flows, dtype=np.float64))
+
+
+def _present_value_factors(discount_rate: float, periods: np.ndarray) -> np.ndarray:
+    """
+    Compute the present value factor 1 / (1 + discount_rate) ** period for each period.
+    
+    When periods are the consecutive integers 1..n, the factors are built as a running
+    product of 1 / (1 + discount_rate), which needs one multiply per period instead of
+    one pow per period. Otherwise the inverse base is raised to each period, so the
+    result is applied with a multiply rather than a divide.
+    
+    Args:
+        discount_rate (float): The discount rate per period.
+        periods (np.ndarray): Period indices.
         
     Returns:
-        List[float]: A cumulative cash flow list.
+        np.ndarray: The present value factor for each period.
     """
-    cumulative = []
-    total = 0.0
-    for flow in net_flows:
-        total += flow
-        cumulative.append(total)
-    return cumulative
+    count = periods.shape[0]
+    inverse_base = 1.0 / (1.0 + discount_rate)
+    if np.array_equal(periods, np.arange(1, count + 1)):
+        return np.cumprod(np.full(count, inverse_base, dtype=np.float64))
+    return np.power(inverse_base, periods)
 
 
-def apply_discount_rate(cash_flows: List[float], discount_rate: float, periods: List[int] = None) -> List[float]:
+def apply_discount_rate(cash_flows: List[float], discount_rate: float, periods: List[int] = None) -> np.ndarray:
     """
     Apply a discount rate to each cash flow to determine its present value.
     
     Args:
-        cash_flows (List[float]): A list of cash flows (e.g., net flows) for each period.
+        cash_flows (List[float]): A list (or array) of cash flows (e.g., net flows) for each period.
         discount_rate (float): The discount rate per period (e.g., for monthly discounting, an annual rate divided by 12).
         periods (List[int], optional): A list of period indices (starting at 1). If not provided, periods will be assumed to sequentially start at 1.
     
     Returns:
-        List[float]: A list of discounted cash flows for each period.
+        np.ndarray: An array of discounted cash flows for each period.
     
     Raises:
         ValueError: If the length of periods does not match the length of cash_flows.
     """
+    cash_flows_arr = np.asarray(cash_flows, dtype=np.float64)
     if periods is None:
-        periods = list(range(1, len(cash_flows) + 1))
-    if len(cash_flows) != len(periods):
+        periods_arr = np.arange(1, len(cash_flows_arr) + 1, dtype=np.float64)
+    else:
+        periods_arr = np.asarray(periods, dtype=np.float64)
+    if cash_flows_arr.shape != periods_arr.shape:
         raise ValueError("Length of cash_flows and periods must match")
-    return [cf / ((1 + discount_rate) ** period) for cf, period in zip(cash_flows, periods)]
+    return cash_flows_arr * _present_value_factors(discount_rate, periods_arr)
 
 
-def compute_cumulative_discounted_cash_flow(discounted_cash_flows: List[float]) -> List[float]:
+def compute_cumulative_discounted_cash_flow(discounted_cash_flows: List[float]) -> np.ndarray:
     """
     Compute the cumulative sum of discounted cash flows.
     
     Args:
-        discounted_cash_flows (List[float]): A list of discounted cash flows.
+        discounted_cash_flows (List[float]): A list (or array) of discounted cash flows.
+        
+    Returns:
+        np.ndarray: An array showing the cumulative discounted cash flow for each period.
+    """
+    return np.cumsum(np.asarray(discounted_cash_flows, dtype=np.float64))
+
+
+def _cash_flow_kernel(
+    inflows: np.ndarray,
+    outflows: np.ndarray,
+    discount_factors: np.ndarray
+) -> np.ndarray:
+    """
+    Compute all four cash flow stages into a single preallocated (4, n) buffer.
+    
+    Each stage writes into its own row via `out=`, so no intermediate arrays are
+    materialized between stages.
+    
+    Args:
+        inflows (np.ndarray): Cash inflows per period.
+        outflows (np.ndarray): Cash outflows per period.
+        discount_factors (np.ndarray): Present value factor for each period.
         
     Returns:
-        List[float]: A list showing the cumulative discounted cash flow for each period.
+        np.ndarray: Rows of net, cumulative, discounted and cumulative discounted flows.
     """
-    cumulative_discounted = []
-    total = 0.0
-    for dc in discounted_cash_flows:
-        total += dc
-        cumulative_discounted.append(total)
-    return cumulative_discounted
+    result = np.empty((4, inflows.shape[0]), dtype=np.float64)
+    net, cumulative, discounted, cumulative_discounted = result
+    np.subtract(inflows, outflows, out=net)
+    np.cumsum(net, out=cumulative)
+    np.multiply(net, discount_factors, out=discounted)
+    np.cumsum(discounted, out=cumulative_discounted)
+    return result
 
 
 def generate_cash_flow_statement(
@@ -83,7 +167,7 @@ def generate_cash_flow_statement(
     outflows: List[float],
     discount_rate: float,
     periods: List[int] = None
-) -> Dict[str, List[float]]:
+) -> CashFlowStatement:
     """
     Generate a comprehensive cash flow statement that includes:
       - Net cash flow per period
@@ -98,20 +182,29 @@ def generate_cash_flow_statement(
         periods (List[int], optional): Period indices. Defaults to sequential numbering starting at 1.
         
     Returns:
-        Dict[str, List[float]]: A dictionary with keys:
-            - "net_cash_flow"
-            - "cumulative_cash_flow"
-            - "discounted_cash_flow"
-            - "cumulative_discounted_cash_flow"
-    """
-    net_flows = compute_net_cash_flow(inflows, outflows)
-    cumulative_flows = compute_cumulative_flow(net_flows)
-    discounted_flows = apply_discount_rate(net_flows, discount_rate, periods)
-    cumulative_discounted = compute_cumulative_discounted_cash_flow(discounted_flows)
+        CashFlowStatement: The per-period arrays of the statement. Callers that need
+        plain lists (e.g. for JSON) should call `.to_dict()` once at the API boundary.
+    """
+    inflows_arr = np.asarray(inflows, dtype=np.float64)
+    outflows_arr = np.asarray(outflows, dtype=np.float64)
+    if inflows_arr.shape != outflows_arr.shape:
+        raise ValueError("The number of inflows must equal the number of outflows.")
+    if periods is None:
+        periods_arr = np.arange(1, len(inflows_arr) + 1, dtype=np.float64)
+    else:
+        periods_arr = np.asarray(periods, dtype=np.float64)
+    if inflows_arr.shape != periods_arr.shape:
+        raise ValueError("Length of cash_flows and periods must match")
+
+    discount_factors = _present_value_factors(discount_rate, periods_arr)
+
+    net_flows, cumulative_flows, discounted_flows, cumulative_discounted = _cash_flow_kernel(
+        inflows_arr, outflows_arr, discount_factors
+    )
     
-    return {
-        "net_cash_flow": net_flows,
-        "cumulative_cash_flow": cumulative_flows,
-        "discounted_cash_flow": discounted_flows,
-        "cumulative_discounted_cash_flow": cumulative_discounted,
-    }
\ No newline at end of file
+    return CashFlowStatement(
+        net=net_flows,
+        cumulative=cumulative_flows,
+        discounted=discounted_flows,
+        cumulative_discounted=cumulative_discounted,
+    )
\ No newline at end of file
@@ -1,4 +1,20 @@
-from typing import List, Dict, Any
+from operator import itemgetter
+from typing import List, Dict, Any, Tuple
+
+import numpy as np
+
+_LINE_ITEM_FIELDS = itemgetter("quantity", "unit_price", "description")
+
+
+def _extract_line_item(item: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+    """
+    Extract the quantity, unit price and description of a cost item in one lookup.
+    Falls back to defaults only when a key is missing.
+    """
+    try:
+        return _LINE_ITEM_FIELDS(item)
+    except KeyError:
+        return item.get("quantity", 0), item.get("unit_price", 0), item.get("description", "")
 
 
 def calculate_line_item(quantity: float, unit_price: float) -> float:
@@ -19,13 +35,16 @@ def calculate_subtotal(line_totals: List[float]) -> float:
     """
     Calculate the subtotal by summing up all line item totals.
     
+    Uses NumPy's pairwise summation, which is both vectorized and more accurate
+    than a sequential running sum.
+    
     Args:
-        line_totals (List[float]): A list of line item totals.
+        line_totals (List[float]): A list (or array) of line item totals.
         
     Returns:
         float: The subtotal amount.
     """
-    return sum(line_totals)
+    return float(np.asarray(line_totals, dtype=np.float64).sum())
 
 
 def calculate_tax(subtotal: float, tax_rate: float) -> float:
@@ -85,24 +104,28 @@ def generate_estimation_summary(
                         - "tax": Computed tax based on subtotal and tax rate
                         - "grand_total": Subtotal plus tax
     """
-    computed_items = []
-    line_totals = []
+    count = len(line_items)
+    raw_quantities, raw_unit_prices, descriptions = (
+        zip(*map(_extract_line_item, line_items)) if count else ((), (), ())
+    )
+    # Convert quantities and unit prices into contiguous arrays (SoA) once.
+    quantities = np.fromiter(map(float, raw_quantities), dtype=np.float64, count=count)
+    unit_prices = np.fromiter(map(float, raw_unit_prices), dtype=np.float64, count=count)
+    line_totals = np.multiply(quantities, unit_prices)
 
-    for item in line_items:
-        # Ensure proper conversion of quantity and unit_price to float values.
-        qty = float(item.get("quantity", 0))
-        up = float(item.get("unit_price", 0))
-        line_total = calculate_line_item(qty, up)
-        
-        computed_items.append({
-            "description": item.get("description", ""),
+    computed_items = [
+        {
+            "description": description,
             "quantity": qty,
             "unit_price": up,
             "line_subtotal": line_total
-        })
-        line_totals.append(line_total)
+        }
+        for description, qty, up, line_total in zip(
+            descriptions, quantities.tolist(), unit_prices.tolist(), line_totals.tolist()
+        )
+    ]
     
-    subtotal = calculate_subtotal(line_totals)
+    subtotal = float(line_totals.sum())
     tax = calculate_tax(subtotal, tax_rate)
     grand_total = calculate_grand_total(subtotal, tax)
     
@@ -1,49 +1,62 @@
 import os
 import logging
+from functools import lru_cache
 from dotenv import load_dotenv
 from langchain.chat_models import AzureChatOpenAI
 from langchain.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
-from langchain.callbacks.base import CallbackManager
 
 logger = logging.getLogger(__name__)
 
 load_dotenv()
 
 # Load environment variables
-
+_REQUIRED_VARS = frozenset({
+    "AZURE_OPENAI_MODEL",
+    "AZURE_OPENAI_BASE",
+    "AZURE_OPENAI_KEY",
+    "AZURE_OPENAI_VERSION",
+})
+
+@lru_cache(maxsize=2)
 def get_llm(streaming=False):
-    callbacks = [StreamingStdOutCallbackHandler()] if streaming else None
-
-    # Check if required env vars exist
-    required_vars = ["AZURE_OPENAI_MODEL", "AZURE_OPENAI_BASE", "AZURE_OPENAI_KEY", "AZURE_OPENAI_VERSION"]
-    for var in required_vars:
-        if var not in os.environ:
-            logger.error(f"Missing required environment variable: {var}")
-            raise ValueError(f"Missing required environment variable: {var}")
+    """
+    Build the Azure OpenAI chat model, cached per `streaming` flag so the client
+    and its HTTP connection pool are reused across agents and requests.
+    Call `get_llm.cache_clear()` after changing the Azure environment variables.
+    """
+    # Check if required env vars exist, reporting all missing ones at once
+    missing_vars = _REQUIRED_VARS - os.environ.keys()
+    if missing_vars:
+        missing = ", ".join(sorted(missing_vars))
+        logger.error("Missing required environment variables: %s", missing)
+        raise ValueError(f"Missing required environment variables: {missing}")
 
     model_name = os.environ["AZURE_OPENAI_MODEL"].split(",")[1]
-    logger.info(f"Using Azure OpenAI model: {model_name}")
+    logger.info("Using Azure OpenAI model: %s", model_name)
 
     base_url = os.environ["AZURE_OPENAI_BASE"]
     if not base_url.endswith("/"):
         base_url += "/"
     base_url += "openai/deployments/"
 
-    logger.info(f"Using Azure endpoint: {base_url}")
+    logger.info("Using Azure endpoint: %s", base_url)
+
+    llm_kwargs = {
+        "openai_api_key": os.environ["AZURE_OPENAI_KEY"],
+        "openai_api_base": base_url,
+        "deployment_name": os.environ["AZURE_OPENAI_MODEL"],
+        "openai_api_type": "azure",
+        "openai_api_version": os.environ["AZURE_OPENAI_VERSION"],
+        "request_timeout": 300,
+    }
+    # Only attach callbacks when streaming; otherwise leave them unset entirely.
+    if streaming:
+        llm_kwargs["callbacks"] = [StreamingStdOutCallbackHandler()]
 
     try:
-        llm = AzureChatOpenAI(
-            openai_api_key=os.environ["AZURE_OPENAI_KEY"],
-            openai_api_base=base_url,
-            deployment_name=os.environ["AZURE_OPENAI_MODEL"],
-            openai_api_type="azure",
-            openai_api_version=os.environ["AZURE_OPENAI_VERSION"],
-            streaming=streaming,
-            callbacks=callbacks,
-            request_timeout=300,
-        )
+        llm = AzureChatOpenAI(streaming=streaming, **llm_kwargs)
         return llm
 
     except Exception as ex:
-        logger.error(f"Error initializing Azure OpenAI: {str(ex)}")
+        logger.error("Error initializing Azure OpenAI: %s", ex)
         raise
@@ -1,19 +1,16 @@
 import logging
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional
 
 from base_agent import BaseAgent
+from prompts._common import ContextLike
 from prompt_cash_flow import (
-    SYSTEM_PROMPT_CASH_FLOW,
+    CASH_FLOW_SYSTEM_PROMPT,
+    CASH_FLOW_STATIC_PREFIX,
     build_cash_flow_prompt
 )
 
 # Example imports for tools; adjust as needed.
-from tools.yahoo_finance import (
-    yahoo_finance_market_data,
-    yahoo_finance_financials,
-    yahoo_market_sizing,
-    yahoo_industry_peers
-)
+from tools.yahoo_finance import YAHOO_FINANCE_TOOLS
 
 logger = logging.getLogger(__name__)
 
@@ -23,30 +20,25 @@ class CashFlowAgent(BaseAgent):
     It uses external data sources to enrich the analysis.
     """
 
-    def get_tools(self) -> List:
-        """
-        Returns a list of tools (functions) accessible by this agent for data gathering.
-        Override if more tools are needed.
-        """
-        logger.info("Registering tools for CashFlowAgent.")
-        return [
-            yahoo_finance_market_data,
-            yahoo_finance_financials,
-            yahoo_market_sizing,
-            yahoo_industry_peers
-        ]
+    TOOLS = YAHOO_FINANCE_TOOLS
 
     def get_system_prompt(self) -> str:
         """
         Returns the system prompt guiding the LLM in producing the desired output.
         """
-        return SYSTEM_PROMPT_CASH_FLOW
+        return CASH_FLOW_SYSTEM_PROMPT
+
+    def get_static_prompt(self) -> str:
+        """
+        Returns the static instructions sent ahead of every project-specific prompt.
+        """
+        return CASH_FLOW_STATIC_PREFIX
 
     def _format_input(
         self,
         project_name: str,
         project_description: str,
-        additional_context: Optional[str] = None
+        additional_context: Optional[ContextLike] = None
     ) -> str:
         """
         Formats the agent input using the build_cash_flow_prompt function.
@@ -54,32 +46,72 @@ class CashFlowAgent(BaseAgent):
         Args:
             project_name (str): The name of the project.
             project_description (str): Description of the project.
-            additional_context (Optional[str]): Additional context or details.
+            additional_context (Optional[ContextLike]): Additional context or details.
         """
-        logger.info(f"Formatting cash flow prompt for project: {project_name}")
+        logger.info("Formatting cash flow prompt for project: %s", project_name)
         return build_cash_flow_prompt(
             project_name,
             project_description,
             additional_context
         )
 
+
 def generate_cash_flow(
     project_name: str,
     project_description: str,
-    additional_context: Optional[str] = None,
+    additional_context: Optional[ContextLike] = None,
     streaming: bool = False
 ) -> Dict[str, Any]:
     """
-    Convenience function to instantiate a CashFlowAgent and generate a cash flow projection.
+    Convenience function to use a shared CashFlowAgent and generate a cash flow projection.
 
     Args:
         project_name (str): Name of the project.
         project_description (str): A brief description of the project.
-        additional_context (Optional[str]): Additional context details for the analysis.
+        additional_context (Optional[ContextLike]): Additional context details for the analysis.
         streaming (bool): Whether the LLM should stream responses or not.
 
     Returns:
         Dict[str, Any]: Dictionary containing the generated output and metadata.
     """
-    agent = CashFlowAgent(streaming=streaming)
-    return agent.generate(project_name, project_description, additional_context)
+    return CashFlowAgent.shared(streaming).generate(project_name, project_description, additional_context)
+
+
+async def generate_cash_flow_async(
+    project_name: str,
+    project_description: str,
+    additional_context: Optional[ContextLike] = None,
+    streaming: bool = False
+) -> Dict[str, Any]:
+    """
+    Async counterpart of `generate_cash_flow`.
+
+    Args:
+        project_name (str): Name of the project.
+        project_description (str): A brief description of the project.
+        additional_context (Optional[ContextLike]): Additional context details for the analysis.
+        streaming (bool): Whether the LLM should stream responses or not.
+
+    Returns:
+        Dict[str, Any]: Dictionary containing the generated output and metadata.
+    """
+    return await CashFlowAgent.shared(streaming).agenerate(project_name, project_description, additional_context)
+
+
+def stream_cash_flow(
+    project_name: str,
+    project_description: str,
+    additional_context: Optional[ContextLike] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream the progress of a cash flow projection from the shared CashFlowAgent.
+
+    Args:
+        project_name (str): Name of the project.
+        project_description (str): A brief description of the project.
+        additional_context (Optional[ContextLike]): Additional context details for the analysis.
+
+    Returns:
+        AsyncIterator[Dict[str, Any]]: Progress events, ending with the output or an error.
+    """
+    return CashFlowAgent.shared().astream(project_name, project_description, additional_context)
@@ -2,17 +2,14 @@ import logging
 from typing import Dict, Any, Optional, List
 
 from base_agent import BaseAgent
+from prompts._common import ContextLike
 from prompt_cost_estimations import (
-    SYSTEM_PROMPT_ESTIMATIONS,
+    ESTIMATIONS_SYSTEM_PROMPT,
+    ESTIMATIONS_STATIC_PREFIX,
     build_estimations_prompt
 )
 
-from tools.yahoo_finance import (
-    yahoo_finance_market_data,
-    yahoo_finance_financials,
-    yahoo_market_sizing,
-    yahoo_industry_peers
-)
+from tools.yahoo_finance import YAHOO_FINANCE_TOOLS
 
 logger = logging.getLogger(__name__)
 
@@ -22,30 +19,25 @@ class EstimationsAgent(BaseAgent):
     It uses external data sources to gather market rates and relevant benchmarks.
     """
 
-    def get_tools(self) -> List:
-        """
-        Returns a list of tools (functions) accessible by this agent for data gathering.
-        Override if more tools are needed.
-        """
-        logger.info("Registering tools for EstimationsAgent.")
-        return [
-            yahoo_finance_market_data,
-            yahoo_finance_financials,
-            yahoo_market_sizing,
-            yahoo_industry_peers
-        ]
+    TOOLS = YAHOO_FINANCE_TOOLS
 
     def get_system_prompt(self) -> str:
         """
         Returns the system prompt guiding the LLM in producing the desired output.
         """
-        return SYSTEM_PROMPT_ESTIMATIONS
+        return ESTIMATIONS_SYSTEM_PROMPT
+
+    def get_static_prompt(self) -> str:
+        """
+        Returns the static instructions sent ahead of every project-specific prompt.
+        """
+        return ESTIMATIONS_STATIC_PREFIX
 
     def _format_input(
         self,
         project_name: str,
         project_description: str,
-        additional_context: Optional[str] = None
+        additional_context: Optional[ContextLike] = None
     ) -> str:
         """
         Formats the agent input using the build_estimations_prompt function.
@@ -57,9 +49,9 @@ class EstimationsAgent(BaseAgent):
         Args:
             project_name (str): The name of the project.
             project_description (str): Used here as the date for the estimation.
-            additional_context (Optional[str]): Additional context or details.
+            additional_context (Optional[ContextLike]): Additional context or details.
         """
-        logger.info(f"Formatting cost estimations prompt for project: {project_name}")
+        logger.info("Formatting cost estimations prompt for project: %s", project_name)
         # Adjust the expiration date as needed; here it's set to "N/A" for demonstration.
         return build_estimations_prompt(
             project_name=project_name,
@@ -70,23 +62,69 @@ class EstimationsAgent(BaseAgent):
             additional_context=additional_context
         )
 
+
 def generate_estimations(
     project_name: str,
     estimation_date: str,
-    additional_context: Optional[str] = None,
+    additional_context: Optional[ContextLike] = None,
     streaming: bool = False
 ) -> Dict[str, Any]:
     """
-    Convenience function to instantiate an EstimationsAgent and generate cost estimations.
+    Convenience function to use a shared EstimationsAgent and generate cost estimations.
 
     Args:
         project_name (str): Name of the project.
         estimation_date (str): Date of the estimation (or project description).
-        additional_context (Optional[str]): Additional context or details.
+        additional_context (Optional[ContextLike]): Additional context or details.
         streaming (bool): Whether the LLM should stream responses or not.
 
     Returns:
         Dict[str, Any]: Dictionary containing the generated output and metadata.
     """
-    agent = EstimationsAgent(streaming=streaming)
-    return agent.generate(project_name, estimation_date, additional_context)
+    return EstimationsAgent.shared(streaming).generate(project_name, estimation_date, additional_context)
+
+
+async def generate_estimations_async(
+    project_name: str,
+    estimation_date: str,
+    additional_context: Optional[ContextLike] = None,
+    streaming: bool = False
+) -> Dict[str, Any]:
+    """
+    Async counterpart of `generate_estimations`.
+
+    Args:
+        project_name (str): Name of the project.
+        estimation_date (str): Date of the estimation (or project description).
+        additional_context (Optional[ContextLike]): Additional context or details.
+        streaming (bool): Whether the LLM should stream responses or not.
+
+    Returns:
+        Dict[str, Any]: Dictionary containing the generated output and metadata.
+    """
+    return await EstimationsAgent.shared(streaming).agenerate(project_name, estimation_date, additional_context)
+
+
+def generate_estimations_batch(
+    projects: List[Dict[str, Any]],
+    streaming: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Generate cost estimations for several projects concurrently.
+
+    Args:
+        projects (List[Dict[str, Any]]): Dicts with "project_name", "estimation_date"
+            and optionally "additional_context".
+        streaming (bool): Whether the LLM should stream responses or not.
+
+    Returns:
+        List[Dict[str, Any]]: One result dictionary per project, in input order.
+    """
+    return EstimationsAgent.shared(streaming).run_batch([
+        {
+            "project_name": project["project_name"],
+            "project_description": project["estimation_date"],
+            "additional_context": project.get("additional_context")
+        }
+        for project in projects
+    ])
@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from typing import Dict, Any, Optional
+
+from prompts._common import ContextLike
+
+logger = logging.getLogger(__name__)
+
+
+async def generate_financial_analysis(
+    project_name: str,
+    project_description: str,
+    additional_context: Optional[ContextLike] = None,
+    streaming: bool = False
+) -> Dict[str, Any]:
+    """
+    Build a comprehensive financial analysis by running the cash flow, resource planning
+    and revenue modeling agents concurrently. The agent calls are independent and
+    network-bound, so the total latency is that of the slowest agent.
+
+    Args:
+        project_name (str): Name of the project.
+        project_description (str): A brief description of the project.
+        additional_context (Optional[ContextLike]): Additional context details for the analysis.
+        streaming (bool): Whether the LLM should stream responses or not.
+
+    Returns:
+        Dict[str, Any]: Dictionary matching the fields of FinancialAnalysisResponse.
+    """
+    # Agent modules are imported on first use so callers only load the agents they run.
+    from agents.cash_flow import generate_cash_flow_async
+    from agents.resource_planning import generate_resource_plan_async
+    from agents.revenue_modeling import generate_revenue_models_async
+
+    logger.info("Generating financial analysis for project: %s", project_name)
+    cash_flow, resource_plan, revenue_models = await asyncio.gather(
+        generate_cash_flow_async(project_name, project_description, additional_context, streaming),
+        generate_resource_plan_async(project_name, additional_context, streaming),
+        generate_revenue_models_async(project_name, additional_context, streaming)
+    )
+    results = (cash_flow, resource_plan, revenue_models)
+    errors = [result["error"] for result in results if result.get("error")]
+
+    return {
+        "project_name": project_name,
+        "success": all(result.get("success") for result in results),
+        "team_structure": resource_plan.get("output"),
+        "cash_flow_projection": cash_flow.get("output"),
+        "income_statement": revenue_models.get("output"),
+        "error": "; ".join(errors) if errors else None,
+    }
+
+
+async def generate_project_bundle(
+    project_name: str,
+    estimation_date: str,
+    additional_context: Optional[ContextLike] = None,
+    streaming: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run the cost estimation, resource planning and revenue modeling agents for the
+    same project concurrently.
+
+    Args:
+        project_name (str): Name of the project.
+        estimation_date (str): Date of the estimation (or project description).
+        additional_context (Optional[ContextLike]): Additional context or details.
+        streaming (bool): Whether the LLM should stream responses or not.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: The raw agent results keyed by "estimations",
+        "resource_plan" and "revenue_models".
+    """
+    from agents.cost_estimations import generate_estimations_async
+    from agents.resource_planning import generate_resource_plan_async
+    from agents.revenue_modeling import generate_revenue_models_async
+
+    logger.info("Generating project bundle for project: %s", project_name)
+    estimations, resource_plan, revenue_models = await asyncio.gather(
+        generate_estimations_async(project_name, estimation_date, additional_context, streaming),
+        generate_resource_plan_async(project_name, additional_context, streaming),
+        generate_revenue_models_async(project_name, additional_context, streaming)
+    )
+    return {
+        "estimations": estimations,
+        "resource_plan": resource_plan,
+        "revenue_models": revenue_models,
+    }
@@ -1,17 +1,14 @@
 import logging
 from typing import Dict, Any, Optional, List
 from base_agent import BaseAgent
+from prompts._common import ContextLike
 from prompts.prompt_resource_planning import (
     RESOURCE_PLANNING_SYSTEM_PROMPT,
+    RESOURCE_PLANNING_STATIC_PREFIX,
     get_resource_planning_prompt
 )
 
-from tools.yahoo_finance import (
-    yahoo_finance_market_data,
-    yahoo_finance_financials,
-    yahoo_market_sizing,
-    yahoo_industry_peers
-)
+from tools.yahoo_finance import YAHOO_FINANCE_TOOLS
 
 logger = logging.getLogger(__name__)
 
@@ -21,18 +18,7 @@ class ResourcePlanningAgent(BaseAgent):
     in an Excel-like structure, along with relevant assumptions (WACC, exchange rates, etc.).
     """
 
-    def get_tools(self) -> List:
-        """
-        Return a list of tools for data gathering about typical roles, rates,
-        and industry benchmarks. Override if additional tools are needed.
-        """
-        logger.info("Registering tools for ResourcePlanningAgent.")
-        return [
-            yahoo_finance_market_data,
-            yahoo_finance_financials,
-            yahoo_market_sizing,
-            yahoo_industry_peers
-        ]
+    TOOLS = YAHOO_FINANCE_TOOLS
 
     def get_system_prompt(self) -> str:
         """
@@ -40,25 +26,29 @@ class ResourcePlanningAgent(BaseAgent):
         """
         return RESOURCE_PLANNING_SYSTEM_PROMPT
 
+    def get_static_prompt(self) -> str:
+        """
+        Returns the static instructions sent ahead of every project-specific prompt.
+        """
+        return RESOURCE_PLANNING_STATIC_PREFIX
+
     def _format_input(
         self,
         project_name: str,
         project_description: str,
-        industry: str,
-        additional_context: Optional[str] = None
+        additional_context: Optional[ContextLike] = None
     ) -> str:
         """
         Format the input for the agent. The BaseAgent requires a signature with
-        project_name, project_description, and industry, though they may not
-        be used if not needed.
+        project_name and project_description, though the description is not used.
         """
-        logger.info(f"Creating resource planning prompt for project: {project_name}.")
+        logger.info("Creating resource planning prompt for project: %s.", project_name)
         return get_resource_planning_prompt(project_name, additional_context)
 
 
 def generate_resource_plan(
     project_name: str,
-    additional_context: Optional[str] = None,
+    additional_context: Optional[ContextLike] = None,
     streaming: bool = False
 ) -> Dict[str, Any]:
     """
@@ -66,16 +56,62 @@ def generate_resource_plan(
 
     Args:
         project_name (str): The project name.
-        additional_context (Optional[str]): Additional context or instructions.
+        additional_context (Optional[ContextLike]): Additional context or instructions.
         streaming (bool): Whether to stream the output from the model.
 
     Returns:
         Dict[str, Any]: The generated resource plan, including 'output', 'success', etc.
     """
-    agent = ResourcePlanningAgent(streaming=streaming)
-    return agent.generate(
+    return ResourcePlanningAgent.shared(streaming).generate(
+        project_name=project_name,
+        project_description="",
+        additional_context=additional_context
+    )
+
+
+async def generate_resource_plan_async(
+    project_name: str,
+    additional_context: Optional[ContextLike] = None,
+    streaming: bool = False
+) -> Dict[str, Any]:
+    """
+    Async counterpart of `generate_resource_plan`.
+
+    Args:
+        project_name (str): The project name.
+        additional_context (Optional[ContextLike]): Additional context or instructions.
+        streaming (bool): Whether to stream the model's output.
+
+    Returns:
+        Dict[str, Any]: The generated resource plan, including 'output', 'success', etc.
+    """
+    return await ResourcePlanningAgent.shared(streaming).agenerate(
         project_name=project_name,
         project_description="",
-        industry="",
         additional_context=additional_context
     )
+
+
+def generate_resource_plan_batch(
+    projects: List[Dict[str, Any]],
+    streaming: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Generate resource plans for several projects concurrently.
+
+    Args:
+        projects (List[Dict[str, Any]]): Dicts with "project_name" and optionally
+            "additional_context".
+        streaming (bool): Whether to stream the model's output.
+
+    Returns:
+        List[Dict[str, Any]]: One result dictionary per project, in input order.
+    """
+    return ResourcePlanningAgent.shared(streaming).run_batch([
+        {
+            "project_name": project["project_name"],
+            "project_description": "",
+            "additional_context": project.get("additional_context")
+        }
+        for project in projects
+    ])
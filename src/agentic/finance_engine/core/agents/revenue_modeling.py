@@ -2,18 +2,15 @@ import logging
 from typing import Dict, Any, Optional, List
 
 from base_agent import BaseAgent
+from prompts._common import ContextLike
 from prompts.prompt_revenue_modeling import (
     REVENUE_MODELING_SYSTEM_PROMPT,
+    REVENUE_MODELING_STATIC_PREFIX,
     get_revenue_modeling_prompt
 )
 
 # Example data-gathering tools; replace or extend as needed.
-from tools.yahoo_finance import (
-    yahoo_finance_market_data,
-    yahoo_finance_financials,
-    yahoo_market_sizing,
-    yahoo_industry_peers
-)
+from tools.yahoo_finance import YAHOO_FINANCE_TOOLS
 
 logger = logging.getLogger(__name__)
 
@@ -23,17 +20,7 @@ class RevenueModelingAgent(BaseAgent):
     and selecting a recommended strategy for a given project.
     """
 
-    def get_tools(self) -> List:
-        """
-        Returns a list of data-gathering tools for market analysis and competitor research.
-        """
-        logger.info("Registering tools for RevenueModelingAgent.")
-        return [
-            yahoo_finance_market_data,
-            yahoo_finance_financials,
-            yahoo_market_sizing,
-            yahoo_industry_peers
-        ]
+    TOOLS = YAHOO_FINANCE_TOOLS
 
     def get_system_prompt(self) -> str:
         """
@@ -41,23 +28,29 @@ class RevenueModelingAgent(BaseAgent):
         """
         return REVENUE_MODELING_SYSTEM_PROMPT
 
+    def get_static_prompt(self) -> str:
+        """
+        Returns the static instructions sent ahead of every project-specific prompt.
+        """
+        return REVENUE_MODELING_STATIC_PREFIX
+
     def _format_input(
         self,
         project_name: str,
         project_description: str,
-        industry: str,
-        additional_context: Optional[str] = None
+        additional_context: Optional[ContextLike] = None
     ) -> str:
         """
         Format the prompt input. BaseAgent requires these parameters,
-        but project_description and industry may not be used if not needed.
+        but project_description is not used.
         """
-        logger.info(f"Creating revenue modeling prompt for project: {project_name}.")
+        logger.info("Creating revenue modeling prompt for project: %s.", project_name)
         return get_revenue_modeling_prompt(project_name, additional_context)
 
+
 def generate_revenue_models(
     project_name: str,
-    additional_context: Optional[str] = None,
+    additional_context: Optional[ContextLike] = None,
     streaming: bool = False
 ) -> Dict[str, Any]:
     """
@@ -65,16 +58,62 @@ def generate_revenue_models(
 
     Args:
         project_name (str): The name of the project.
-        additional_context (Optional[str]): Additional context or instructions.
+        additional_context (Optional[ContextLike]): Additional context or instructions.
         streaming (bool): Whether to stream the model's output.
 
     Returns:
         Dict[str, Any]: A dictionary containing the generated revenue models, recommendation, etc.
     """
-    agent = RevenueModelingAgent(streaming=streaming)
-    return agent.generate(
+    return RevenueModelingAgent.shared(streaming).generate(
         project_name=project_name,
         project_description="",
-        industry="",
         additional_context=additional_context
     )
+
+
+async def generate_revenue_models_async(
+    project_name: str,
+    additional_context: Optional[ContextLike] = None,
+    streaming: bool = False
+) -> Dict[str, Any]:
+    """
+    Async counterpart of `generate_revenue_models`.
+
+    Args:
+        project_name (str): The name of the project.
+        additional_context (Optional[ContextLike]): Additional context or instructions.
+        streaming (bool): Whether to stream the model's output.
+
+    Returns:
+        Dict[str, Any]: A dictionary containing the generated revenue models, recommendation, etc.
+    """
+    return await RevenueModelingAgent.shared(streaming).agenerate(
+        project_name=project_name,
+        project_description="",
+        additional_context=additional_context
+    )
+
+
+def generate_revenue_models_batch(
+    projects: List[Dict[str, Any]],
+    streaming: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Generate revenue models for several projects concurrently.
+
+    Args:
+        projects (List[Dict[str, Any]]): Dicts with "project_name" and optionally
+            "additional_context".
+        streaming (bool): Whether to stream the model's output.
+
+    Returns:
+        List[Dict[str, Any]]: One result dictionary per project, in input order.
+    """
+    return RevenueModelingAgent.shared(streaming).run_batch([
+        {
+            "project_name": project["project_name"],
+            "project_description": "",
+            "additional_context": project.get("additional_context")
+        }
+        for project in projects
+    ])
@@ -0,0 +1,80 @@
+from string import Formatter
+from typing import Any, Mapping, Optional, Tuple, Union
+
+import orjson
+from pydantic import BaseModel
+
+# A template pre-split into (literal, field name) pairs; the field is None for the tail.
+TemplateParts = Tuple[Tuple[str, Optional[str]], ...]
+
+# Additional context as callers pass it: free text, or a structured model or mapping
+# such as the request's AdditionalContext.
+ContextLike = Union[str, BaseModel, Mapping[str, Any]]
+
+
+def split_template(template: str) -> TemplateParts:
+    """
+    Split a str.format-style template into literal chunks and field names once, so
+    rendering never re-parses the placeholders.
+
+    Args:
+        template: A template with plain `{name}` fields (no format specs).
+
+    Returns:
+        The template as a tuple of (literal, field name) pairs.
+    """
+    return tuple((literal, field) for literal, field, _, _ in Formatter().parse(template))
+
+
+def render_template(parts: TemplateParts, values: Mapping[str, Any]) -> str:
+    """
+    Render a template produced by `split_template`. Values are converted with str(),
+    as str.format would.
+
+    Args:
+        parts: The pre-split template.
+        values: Values for every field in the template.
+
+    Returns:
+        The rendered string.
+    """
+    return "".join(
+        literal + (str(values[field]) if field is not None else "")
+        for literal, field in parts
+    )
+
+
+def split_template_variants(template: str) -> Tuple[TemplateParts, TemplateParts]:
+    """
+    Pre-split a template whose last line is optional (such as "Additional Context:
+    {additional_context}") into two variants, indexed by whether that line is wanted.
+
+    Args:
+        template: A template accepted by `split_template`.
+
+    Returns:
+        The parts without the last line, then the parts of the full template.
+    """
+    without_last_line = template.rsplit("\n", 1)[0].rstrip("\n")
+    return split_template(without_last_line), split_template(template)
+
+
+def context_to_str(context: Optional[ContextLike]) -> str:
+    """
+    Serialize additional context into the string the prompt builders render and cache on.
+    Models and mappings become JSON with sorted keys and unset fields dropped, so equal
+    contexts always produce the same string.
+
+    Args:
+        context: Free text, a pydantic model, a mapping, or None.
+
+    Returns:
+        The context as a string; empty if there is no context.
+    """
+    if not context:
+        return ""
+    if isinstance(context, str):
+        return context
+    if isinstance(context, BaseModel):
+        context = context.model_dump(exclude_none=True)
+    return orjson.dumps(context, option=orjson.OPT_SORT_KEYS, default=str).decode()
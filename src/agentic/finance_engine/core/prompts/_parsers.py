@@ -0,0 +1,162 @@
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Type, Union
+
+import orjson
+from pydantic import BaseModel, ValidationError
+
+if TYPE_CHECKING:
+    from langchain.output_parsers import PydanticOutputParser
+
+# A ``` fence with an optional language tag around the whole response; the closing
+# fence may be missing when the reply was cut off.
+_JSON_FENCE = re.compile(r"^```[A-Za-z]*\s*(.*?)\s*(?:```)?$", re.DOTALL)
+
+# Same wording as PydanticOutputParser's instructions, with the schema serialized by orjson.
+_FORMAT_INSTRUCTIONS_TEMPLATE = (
+    "The output should be formatted as a JSON instance that conforms to the JSON schema below.\n\n"
+    "As an example, for the schema {{\"properties\": {{\"foo\": {{\"title\": \"Foo\", "
+    "\"description\": \"a list of strings\", \"type\": \"array\", \"items\": {{\"type\": \"string\"}}}}}}, "
+    "\"required\": [\"foo\"]}}\n"
+    "the object {{\"foo\": [\"bar\", \"baz\"]}} is a well-formatted instance of the schema. "
+    "The object {{\"properties\": {{\"foo\": [\"bar\", \"baz\"]}}}} is not well-formatted.\n\n"
+    "Here is the output schema:\n```\n{schema}\n```"
+)
+
+
+# Schema annotations that help developers but cost prompt tokens on every call.
+_VERBOSE_SCHEMA_KEYS = frozenset({"title", "description"})
+
+
+def _compact_schema(node: Any) -> Any:
+    """
+    Recursively drop titles and descriptions from a JSON schema, keeping structure,
+    types, enums and required fields.
+    """
+    if isinstance(node, list):
+        return [_compact_schema(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    compact = {}
+    for key, value in node.items():
+        if key in _VERBOSE_SCHEMA_KEYS:
+            continue
+        if key in ("properties", "$defs"):
+            # Keys of these mappings are field and model names, not annotations.
+            compact[key] = {name: _compact_schema(sub) for name, sub in value.items()}
+        else:
+            compact[key] = _compact_schema(value)
+    return compact
+
+
+def _inline_single_use_defs(schema: dict) -> dict:
+    """
+    Replace `$ref`s to definitions used exactly once with the definition itself, so
+    the LLM reads nested objects in place. Shared definitions stay in `$defs`.
+    """
+    defs = schema.pop("$defs", {})
+    refs = Counter()
+
+    def count(node: Any) -> None:
+        if isinstance(node, list):
+            for item in node:
+                count(item)
+        elif isinstance(node, dict):
+            if "$ref" in node:
+                refs[node["$ref"].rsplit("/", 1)[1]] += 1
+            for value in node.values():
+                count(value)
+
+    count(schema)
+    for definition in defs.values():
+        count(definition)
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, list):
+            return [inline(item) for item in node]
+        if not isinstance(node, dict):
+            return node
+        if "$ref" in node:
+            name = node["$ref"].rsplit("/", 1)[1]
+            if refs[name] == 1:
+                return inline(defs[name])
+        return {key: inline(value) for key, value in node.items()}
+
+    schema = inline(schema)
+    shared = {name: inline(definition) for name, definition in defs.items() if refs[name] > 1}
+    if shared:
+        schema["$defs"] = shared
+    return schema
+
+
+@lru_cache(maxsize=None)
+def get_output_parser(model: Type[BaseModel]) -> "PydanticOutputParser":
+    """
+    Return the process-wide output parser for a response model.
+
+    Args:
+        model: The Pydantic model the LLM output must follow.
+
+    Returns:
+        A PydanticOutputParser shared by every prompt module using the same model.
+    """
+    return _json_first_parser_class()(pydantic_object=model)
+
+
+@lru_cache(maxsize=1)
+def _json_first_parser_class() -> Type["PydanticOutputParser"]:
+    """
+    Define the output parser class on first use, so loading a prompt module does not
+    pull in langchain's parsers.
+    """
+    from langchain.output_parsers import PydanticOutputParser
+
+    class JsonFirstOutputParser(PydanticOutputParser):
+        """
+        PydanticOutputParser that parses and validates well-formed responses in one pass
+        in pydantic-core, and only falls back to LangChain's lenient JSON extraction
+        (stdlib json plus a separate validation) when that fails.
+        """
+
+        def parse(self, text: str) -> BaseModel:
+            try:
+                return self.pydantic_object.model_validate_json(strip_json_fence(text))
+            except (ValidationError, ValueError, IndexError):
+                return super().parse(text)
+
+    return JsonFirstOutputParser
+
+
+@lru_cache(maxsize=None)
+def get_format_instructions(model: Type[BaseModel]) -> str:
+    """
+    Return the JSON format instructions for a response model, serialized once.
+
+    Args:
+        model: The Pydantic model the LLM output must follow.
+
+    Returns:
+        The format instructions string embedded in the prompts.
+    """
+    schema = _inline_single_use_defs(_compact_schema(model.model_json_schema()))
+    # The top-level type carries no information for the LLM.
+    schema.pop("type", None)
+    return _FORMAT_INSTRUCTIONS_TEMPLATE.format(schema=orjson.dumps(schema).decode())
+
+
+def strip_json_fence(raw: Union[str, bytes]) -> str:
+    """
+    Return the JSON payload of an LLM response, removing a surrounding ```json fence.
+
+    Args:
+        raw: The response text or bytes.
+
+    Returns:
+        The bare JSON text, ready for `model_validate_json`.
+    """
+    if isinstance(raw, bytes):
+        raw = raw.decode()
+    text = raw.strip()
+    fenced = _JSON_FENCE.match(text)
+    return fenced.group(1) if fenced else text
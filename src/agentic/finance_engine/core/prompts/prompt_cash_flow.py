@@ -1,23 +1,53 @@
-from typing import List, Optional
-from pydantic import BaseModel, Field
-from langchain.output_parsers import PydanticOutputParser
+from functools import lru_cache
+from typing import Final, List, Optional
+from pydantic import BaseModel, Field, field_validator
+from pydantic.dataclasses import dataclass
 
+from prompts._common import ContextLike, context_to_str, split_template_variants, render_template
+from prompts._parsers import get_output_parser, get_format_instructions
 
-class KeyMetrics(BaseModel):
+
+# Slotted, frozen dataclasses: no per-instance __dict__, and the JSON schema is unchanged.
+@dataclass(slots=True, frozen=True)
+class KeyMetrics:
     wacc: str = Field(..., description="Weighted Average Cost of Capital (e.g., '15%').")
     irr: str = Field(..., description="Internal Rate of Return (e.g., '26%').")
     npv: str = Field(..., description="Net Present Value (e.g., '29,442').")
     break_even: str = Field(..., description="Break-Even Period (e.g., '3.17').")
 
 
-class CashFlowTable(BaseModel):
+# Thousands separators and currency symbols the LLM sometimes puts in amounts.
+_AMOUNT_FORMATTING = str.maketrans("", "", ",$ ")
+
+# Placeholders the LLM writes for an empty cell; read as zero.
+_EMPTY_AMOUNTS = frozenset({"", "-", "\u2013", "\u2014"})
+
+
+@dataclass(slots=True, frozen=True)
+class CashFlowTable:
     category: str = Field(..., description="Line item category.")
-    month1: str = Field(..., description="Amount for Month 1.")
-    month2: str = Field(..., description="Amount for Month 2.")
-    month3: str = Field(..., description="Amount for Month 3.")
-    month4: str = Field(..., description="Amount for Month 4.")
-    month5: str = Field(..., description="Amount for Month 5.")
-    total: str = Field(..., description="Total amount over five months.")
+    month1: float = Field(..., description="Amount for Month 1.")
+    month2: float = Field(..., description="Amount for Month 2.")
+    month3: float = Field(..., description="Amount for Month 3.")
+    month4: float = Field(..., description="Amount for Month 4.")
+    month5: float = Field(..., description="Amount for Month 5.")
+    total: float = Field(..., description="Total amount over five months.")
+
+    @field_validator("month1", "month2", "month3", "month4", "month5", "total", mode="before")
+    @classmethod
+    def _strip_amount_formatting(cls, value):
+        """
+        Accept amounts written as strings such as "29,442" or "$1,200", accounting
+        negatives such as "(1,200)", and "-" placeholders for empty cells.
+        """
+        if isinstance(value, str):
+            text = value.translate(_AMOUNT_FORMATTING)
+            if text in _EMPTY_AMOUNTS:
+                return 0.0
+            if text.startswith("(") and text.endswith(")"):
+                return "-" + text[1:-1]
+            return text
+        return value
 
 
 class CashFlowProjection(BaseModel):
@@ -29,51 +59,87 @@ class CashFlowProjection(BaseModel):
     additional_notes: str = Field(..., description="Extra notes or assumptions.")
 
 
-# Create an output parser to enforce the JSON schema.
-output_parser = PydanticOutputParser(pydantic_object=CashFlowProjection)
+# Output parser and format instructions are shared process-wide through prompts._parsers.
+FORMAT_INSTRUCTIONS: Final[str] = get_format_instructions(CashFlowProjection)
 
 # System prompt description for context.
-CASH_FLOW_SYSTEM_PROMPT: str = (
+CASH_FLOW_SYSTEM_PROMPT: Final[str] = (
     "You are a financial analysis expert specializing in cash flow projections. "
     "Gather relevant market data and financial metrics before generating the projection. "
     "Format the output as an Excel-like table with columns for Month 1 to Month 5 and a Total. "
     "Return valid JSON adhering strictly to the provided schema."
 )
 
-# Template used for building the cash flow prompt.
-CASH_FLOW_PROMPT_TEMPLATE: str = (
-    "Generate a cash flow projection for the project '{project_name}'.\n\n"
-    "Project Description: {project_description}\n"
-    "Additional Context: {additional_context}\n\n"
+# Static part of the cash flow prompt. It is identical across calls, so it is sent
+# ahead of the per-project details to maximize provider-side prefix caching.
+CASH_FLOW_STATIC_PREFIX: Final[str] = (
     "Steps:\n"
     "1. Research industry trends and relevant market data.\n"
     "2. Determine key financial metrics (WACC, IRR, NPV, Break-Even).\n"
     "3. Construct tables for cash inflows, cash outflows, and net flow with monthly breakdowns and totals.\n\n"
-    "Return the result as valid JSON following this schema:\n{format_instructions}"
+    "Return the result as valid JSON following this schema:\n"
+) + FORMAT_INSTRUCTIONS
+
+# Per-project part of the cash flow prompt.
+CASH_FLOW_DYNAMIC_SUFFIX: Final[str] = (
+    "Generate a cash flow projection for the project '{project_name}'.\n\n"
+    "Project Description: {project_description}\n"
+    "Additional Context: {additional_context}"
 )
 
+# Split the template into (literal, field) pairs once so prompt builds never re-parse it.
+# Indexed by bool(additional_context): the "Additional Context" line is left out when
+# there is nothing to put in it.
+_TEMPLATE_PARTS = split_template_variants(CASH_FLOW_DYNAMIC_SUFFIX)
+
+
+# Deterministic in its inputs; retries and repeated projects reuse the built string.
+@lru_cache(maxsize=1024)
+def _render_cash_flow_prompt(
+    project_name: str,
+    project_description: str,
+    context: str
+) -> str:
+    """
+    Render the prompt. Keyed on positional, normalized arguments so equivalent calls
+    share one cache entry.
+    """
+    values = {
+        "project_name": project_name,
+        "project_description": project_description,
+        "additional_context": context,
+    }
+    return render_template(_TEMPLATE_PARTS[bool(context)], values)
+
 
 def build_cash_flow_prompt(
     project_name: str, 
     project_description: str, 
-    additional_context: Optional[str] = None
+    additional_context: Optional[ContextLike] = None
 ) -> str:
     """
-    Build and return the cash flow projection prompt.
+    Build and return the per-project part of the cash flow projection prompt.
+    The static instructions are in CASH_FLOW_STATIC_PREFIX.
 
     Args:
         project_name: Name of the project.
         project_description: Brief description of the project.
-        additional_context: Optional context; defaults to a generic message if omitted.
+        additional_context: Optional context, as text or a structured model
+            such as AdditionalContext; the line is omitted if empty.
 
     Returns:
         A formatted prompt string.
     """
-    context = additional_context or "No additional context provided."
-    format_instructions = output_parser.get_format_instructions()
-    return CASH_FLOW_PROMPT_TEMPLATE.format(
-        project_name=project_name,
-        project_description=project_description,
-        additional_context=context,
-        format_instructions=format_instructions
+    return _render_cash_flow_prompt(
+        project_name, project_description,
+        context_to_str(additional_context)
     )
+
+
+def __getattr__(name: str):
+    """
+    Build `output_parser` on first access rather than at import time.
+    """
+    if name == "output_parser":
+        return get_output_parser(CashFlowProjection)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
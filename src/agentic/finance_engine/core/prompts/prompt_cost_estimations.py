@@ -1,9 +1,14 @@
-from typing import List, Optional
+from functools import lru_cache
+from typing import Final, List, Literal, Optional
 from pydantic import BaseModel, Field
-from langchain.output_parsers import PydanticOutputParser
+from pydantic.dataclasses import dataclass
 
+from prompts._common import ContextLike, context_to_str, split_template_variants, render_template
+from prompts._parsers import get_output_parser, get_format_instructions
 
-class CostEstimationItem(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class CostEstimationItem:
     project_item: str = Field(..., description="Name of the project item.")
     cost_description: str = Field(..., description="Description of the associated cost.")
     quantity: float = Field(..., description="Quantity (units or hours).")
@@ -11,7 +16,7 @@ class CostEstimationItem(BaseModel):
 
 
 class CostEstimationBreakdown(BaseModel):
-    cost_type: str = Field(..., description="Cost category (e.g., 'Fixed', 'Variable').")
+    cost_type: Literal["Fixed", "Variable", "Additional"] = Field(..., description="Cost category.")
     details: Optional[str] = Field(None, description="Additional details for the category.")
     cost: float = Field(..., description="Total cost for this category.")
 
@@ -28,30 +33,60 @@ class CostEstimation(BaseModel):
     considerations: Optional[str] = Field(None, description="Additional notes or considerations.")
 
 
-# Create an output parser to enforce the JSON schema.
-output_parser = PydanticOutputParser(pydantic_object=CostEstimation)
+# Output parser and format instructions are shared process-wide through prompts._parsers.
+FORMAT_INSTRUCTIONS: Final[str] = get_format_instructions(CostEstimation)
 
-ESTIMATIONS_SYSTEM_PROMPT: str = (
+ESTIMATIONS_SYSTEM_PROMPT: Final[str] = (
     "You are a cost estimation expert. Gather current market and pricing data using available tools. "
     "Generate an Excel-like cost estimation output that includes company details, an itemized cost list, "
     "a detailed breakdown, and the total estimated cost. Return valid JSON strictly adhering to the provided schema."
 )
 
-ESTIMATIONS_PROMPT_TEMPLATE: str = (
+# Static part of the cost estimation prompt, sent ahead of the per-project details
+# so it forms a cacheable prefix.
+ESTIMATIONS_STATIC_PREFIX: Final[str] = (
+    "Steps:\n"
+    "1. Gather market rates and pricing data.\n"
+    "2. Create an itemized table for project items (columns: Project Item, Cost Description, Quantity, Amount).\n"
+    "3. Construct a detailed breakdown by category (Fixed, Variable, Additional).\n"
+    "4. Calculate the total estimated cost.\n\n"
+    "Return the result as valid JSON following this schema:\n"
+) + FORMAT_INSTRUCTIONS
+
+# Per-project part of the cost estimation prompt.
+ESTIMATIONS_DYNAMIC_SUFFIX: Final[str] = (
     "Generate a cost estimation for the project '{project_name}'.\n\n"
     "Company Name: {company_name}\n"
     "Company Address: {company_address}\n"
     "Date: {date}\n"
     "Expiration Date: {expiration_date}\n"
-    "Additional Context: {additional_context}\n\n"
-    "Steps:\n"
-    "1. Gather market rates and pricing data.\n"
-    "2. Create an itemized table for project items (columns: Project Item, Cost Description, Quantity, Amount).\n"
-    "3. Construct a detailed breakdown by category (e.g., Fixed, Variable).\n"
-    "4. Calculate the total estimated cost.\n\n"
-    "Return the result as valid JSON following this schema:\n{format_instructions}"
+    "Additional Context: {additional_context}"
 )
 
+_TEMPLATE_PARTS = split_template_variants(ESTIMATIONS_DYNAMIC_SUFFIX)
+
+
+@lru_cache(maxsize=1024)
+def _render_estimations_prompt(
+    project_name: str,
+    company_name: str,
+    company_address: str,
+    date: str,
+    expiration_date: str,
+    context: str
+) -> str:
+    """
+    Render the prompt from already-normalized arguments.
+    """
+    return render_template(_TEMPLATE_PARTS[bool(context)], {
+        "project_name": project_name,
+        "company_name": company_name,
+        "company_address": company_address,
+        "date": date,
+        "expiration_date": expiration_date,
+        "additional_context": context,
+    })
+
 
 def build_estimations_prompt(
     project_name: str,
@@ -59,10 +94,11 @@ def build_estimations_prompt(
     company_address: str,
     date: str,
     expiration_date: str,
-    additional_context: Optional[str] = None
+    additional_context: Optional[ContextLike] = None
 ) -> str:
     """
-    Build and return the cost estimation prompt.
+    Build and return the per-project part of the cost estimation prompt.
+    The static instructions are in ESTIMATIONS_STATIC_PREFIX.
 
     Args:
         project_name: Name of the project.
@@ -70,19 +106,22 @@ def build_estimations_prompt(
         company_address: Address of the company.
         date: Estimation date.
         expiration_date: Expiration date of the estimation.
-        additional_context: Optional additional context; defaults to a generic message if omitted.
+        additional_context: Optional additional context, as text or a structured model
+            such as AdditionalContext; the line is omitted if empty.
 
     Returns:
         A formatted prompt string.
     """
-    context = additional_context or "No additional context provided."
-    format_instructions = output_parser.get_format_instructions()
-    return ESTIMATIONS_PROMPT_TEMPLATE.format(
-        project_name=project_name,
-        company_name=company_name,
-        company_address=company_address,
-        date=date,
-        expiration_date=expiration_date,
-        additional_context=context,
-        format_instructions=format_instructions
+    return _render_estimations_prompt(
+        project_name, company_name, company_address, date, expiration_date,
+        context_to_str(additional_context)
     )
+
+
+def __getattr__(name: str):
+    """
+    Build `output_parser` on first access rather than at import time.
+    """
+    if name == "output_parser":
+        return get_output_parser(CostEstimation)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
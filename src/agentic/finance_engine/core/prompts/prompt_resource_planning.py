@@ -1,69 +1,131 @@
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
-from langchain.output_parsers import PydanticOutputParser
+from functools import lru_cache
+from typing import Final, List, Optional
+from pydantic import BaseModel, Field, computed_field
+from pydantic.dataclasses import dataclass
 
+from prompts._common import ContextLike, context_to_str, split_template_variants, render_template
+from prompts._parsers import get_output_parser, get_format_instructions
 
-class ResourceRow(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class ResourceRow:
     role: str = Field(..., description="Job title or role (e.g., 'Product Manager').")
     number_of_people: int = Field(..., description="Number of people in the role.")
     hours: float = Field(..., description="Hours allocated per person.")
     rate: float = Field(..., description="Hourly or daily rate for the role.")
-    total: float = Field(..., description="Total cost (hours * rate * number_of_people).")
+
+    @computed_field
+    @property
+    def total(self) -> float:
+        """
+        Total cost (hours * rate * number_of_people), derived rather than generated.
+        """
+        return self.hours * self.rate * self.number_of_people
 
 
 class ResourcePlanningSheet(BaseModel):
     category_name: str = Field(..., description="Name of the resource category (e.g., 'Product IT').")
     rows: List[ResourceRow] = Field(..., description="List of resource rows under this category.")
-    category_total: float = Field(..., description="Subtotal cost for the category.")
+
+    @computed_field
+    @property
+    def category_total(self) -> float:
+        """
+        Subtotal cost for the category.
+        """
+        return sum((row.total for row in self.rows), 0.0)
+
+
+class Assumptions(BaseModel):
+    duration_months: Optional[int] = Field(None, description="Project duration in months.")
+    wacc: Optional[float] = Field(None, description="Weighted average cost of capital, as a fraction.")
+    escalation_rate: Optional[float] = Field(None, description="Annual rate escalation, as a fraction.")
+    notes: Optional[str] = Field(None, description="Any other assumptions, in free text.")
 
 
 class ResourcePlanning(BaseModel):
     project_name: str = Field(..., description="Project or initiative name.")
     resource_sheets: List[ResourcePlanningSheet] = Field(..., description="Resource planning sheets or categories.")
-    grand_total: float = Field(..., description="Grand total cost across all categories.")
-    assumptions: Optional[Dict[str, Any]] = Field(
-        None, description="Additional assumptions (e.g., project duration, market conditions)."
-    )
+    assumptions: Optional[Assumptions] = Field(None, description="Planning assumptions.")
+
+    @computed_field
+    @property
+    def grand_total(self) -> float:
+        """
+        Grand total cost across all categories.
+        """
+        return sum((sheet.category_total for sheet in self.resource_sheets), 0.0)
 
 
-# Create an output parser to enforce the JSON schema.
-output_parser = PydanticOutputParser(pydantic_object=ResourcePlanning)
+# Output parser and format instructions are shared process-wide through prompts._parsers.
+FORMAT_INSTRUCTIONS: Final[str] = get_format_instructions(ResourcePlanning)
 
-RESOURCE_PLANNING_SYSTEM_PROMPT: str = (
+RESOURCE_PLANNING_SYSTEM_PROMPT: Final[str] = (
     "You are a resource planning expert. Use available tools to gather data on typical roles, market rates, and industry benchmarks. "
-    "Generate a resource plan in an Excel-like format with multiple categories, listing roles with number of people, hours, rates, and computed totals. "
+    "Generate a resource plan in an Excel-like format with multiple categories, listing roles with number of people, hours, and rates. "
     "Return valid JSON following the provided schema, including any relevant assumptions."
 )
 
-RESOURCE_PLANNING_PROMPT_TEMPLATE: str = (
-    "Generate a comprehensive resource plan for the project '{project_name}'.\n\n"
+# Static part of the resource planning prompt, sent ahead of the per-project details
+# so it forms a cacheable prefix.
+RESOURCE_PLANNING_STATIC_PREFIX: Final[str] = (
     "Steps:\n"
     "1. Include multiple categories (e.g., 'Product Development', 'IT Support').\n"
-    "2. For each category, list roles with number of people, allocated hours, rate, and computed total cost.\n"
-    "3. Calculate subtotals for each category and a grand total.\n"
-    "4. Include any relevant assumptions.\n\n"
-    "Return the result as valid JSON following this schema:\n{format_instructions}"
+    "2. For each category, list roles with number of people, allocated hours, and rate. "
+    "Totals are computed from these, so do not include them.\n"
+    "3. Include any relevant assumptions.\n\n"
+    "Return the result as valid JSON following this schema:\n"
+) + FORMAT_INSTRUCTIONS
+
+# Per-project part of the resource planning prompt.
+RESOURCE_PLANNING_DYNAMIC_SUFFIX: Final[str] = (
+    "Generate a comprehensive resource plan for the project '{project_name}'.\n\n"
+    "Additional Context: {additional_context}"
 )
 
+_TEMPLATE_PARTS = split_template_variants(RESOURCE_PLANNING_DYNAMIC_SUFFIX)
+
+
+@lru_cache(maxsize=1024)
+def _render_resource_planning_prompt(
+    project_name: str,
+    context: str
+) -> str:
+    """
+    Render the prompt from already-normalized arguments.
+    """
+    return render_template(_TEMPLATE_PARTS[bool(context)], {
+        "project_name": project_name,
+        "additional_context": context,
+    })
+
 
 def get_resource_planning_prompt(
     project_name: str, 
-    additional_context: Optional[str] = None
+    additional_context: Optional[ContextLike] = None
 ) -> str:
     """
-    Build and return the resource planning prompt.
+    Build and return the per-project part of the resource planning prompt.
+    The static instructions are in RESOURCE_PLANNING_STATIC_PREFIX.
 
     Args:
         project_name: Name of the project.
-        additional_context: Optional context; if omitted, a default message is used.
+        additional_context: Optional context, as text or a structured model
+            such as AdditionalContext; the line is omitted if empty.
 
     Returns:
         A formatted prompt string.
     """
-    context = additional_context or "No additional context provided."
-    format_instructions = output_parser.get_format_instructions()
-    prompt = RESOURCE_PLANNING_PROMPT_TEMPLATE.format(
-        project_name=project_name,
-        format_instructions=format_instructions
+    return _render_resource_planning_prompt(
+        project_name,
+        context_to_str(additional_context)
     )
-    return f"{prompt}\n\nAdditional Context: {context}"
+
+
+def __getattr__(name: str):
+    """
+    Build `output_parser` on first access rather than at import time.
+    """
+    if name == "output_parser":
+        return get_output_parser(ResourcePlanning)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,9 @@
-from typing import List, Optional
+from functools import lru_cache
+from typing import Final, List, Optional
 from pydantic import BaseModel, Field
-from langchain.output_parsers import PydanticOutputParser
+
+from prompts._common import ContextLike, context_to_str, split_template_variants, render_template
+from prompts._parsers import get_output_parser, get_format_instructions
 
 
 class RevenueStrategy(BaseModel):
@@ -19,43 +22,74 @@ class RevenueModelOutput(BaseModel):
     notes: Optional[str] = Field(None, description="Additional notes or considerations.")
 
 
-# Create an output parser to enforce the JSON schema.
-output_parser = PydanticOutputParser(pydantic_object=RevenueModelOutput)
+# Output parser and format instructions are shared process-wide through prompts._parsers.
+FORMAT_INSTRUCTIONS: Final[str] = get_format_instructions(RevenueModelOutput)
 
-REVENUE_MODELING_SYSTEM_PROMPT: str = (
+REVENUE_MODELING_SYSTEM_PROMPT: Final[str] = (
     "You are a revenue modeling expert. Gather current market data, pricing strategies, and financial benchmarks using available tools. "
     "Provide multiple revenue strategies with monthly projections (for 5 months), compute totals, and recommend a viable strategy with rationale. "
     "Return valid JSON strictly following the provided schema."
 )
 
-REVENUE_MODELING_PROMPT_TEMPLATE: str = (
-    "Generate a comprehensive revenue model for the project '{project_name}'.\n\n"
+# Static part of the revenue modeling prompt, sent ahead of the per-project details
+# so it forms a cacheable prefix.
+REVENUE_MODELING_STATIC_PREFIX: Final[str] = (
     "Steps:\n"
     "1. Include multiple revenue strategies (e.g., 'Base Price + Tier', 'Price per Click', 'Subscription', 'Bundle Pricing', 'Penetration Pricing').\n"
     "2. For each strategy, provide monthly revenue projections for 5 months and calculate the total revenue.\n"
     "3. Recommend one strategy with an explanation of the rationale.\n\n"
-    "Return the result as valid JSON following this schema:\n{format_instructions}"
+    "Return the result as valid JSON following this schema:\n"
+) + FORMAT_INSTRUCTIONS
+
+# Per-project part of the revenue modeling prompt.
+REVENUE_MODELING_DYNAMIC_SUFFIX: Final[str] = (
+    "Generate a comprehensive revenue model for the project '{project_name}'.\n\n"
+    "Additional Context: {additional_context}"
 )
 
+_TEMPLATE_PARTS = split_template_variants(REVENUE_MODELING_DYNAMIC_SUFFIX)
+
+
+@lru_cache(maxsize=1024)
+def _render_revenue_modeling_prompt(
+    project_name: str,
+    context: str
+) -> str:
+    """
+    Render the prompt from already-normalized arguments.
+    """
+    return render_template(_TEMPLATE_PARTS[bool(context)], {
+        "project_name": project_name,
+        "additional_context": context,
+    })
+
 
 def get_revenue_modeling_prompt(
     project_name: str, 
-    additional_context: Optional[str] = None
+    additional_context: Optional[ContextLike] = None
 ) -> str:
     """
-    Build and return the revenue modeling prompt.
+    Build and return the per-project part of the revenue modeling prompt.
+    The static instructions are in REVENUE_MODELING_STATIC_PREFIX.
 
     Args:
         project_name: Name of the project.
-        additional_context: Optional context; defaults to a generic message if not provided.
+        additional_context: Optional context, as text or a structured model
+            such as AdditionalContext; the line is omitted if empty.
 
     Returns:
         A formatted prompt string.
     """
-    context = additional_context or "No additional context provided."
-    format_instructions = output_parser.get_format_instructions()
-    prompt = REVENUE_MODELING_PROMPT_TEMPLATE.format(
-        project_name=project_name,
-        format_instructions=format_instructions
+    return _render_revenue_modeling_prompt(
+        project_name,
+        context_to_str(additional_context)
     )
-    return f"{prompt}\n\nAdditional Context: {context}"
+
+
+def __getattr__(name: str):
+    """
+    Build `output_parser` on first access rather than at import time.
+    """
+    if name == "output_parser":
+        return get_output_parser(RevenueModelOutput)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
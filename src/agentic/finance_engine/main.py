@@ -1,14 +1,37 @@
 import os
+import sys
 import logging
+import orjson
+from pathlib import Path
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
-from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from typing import Dict, Any
 
 from dotenv import load_dotenv
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
+
+# The engine's modules import each other by flat names (`base_agent`, `prompt_cash_flow`,
+# `agents.cash_flow`, `agentic.finance_engine...`), so put their directories on the path
+# before importing them.
+_ENGINE_DIR = Path(__file__).resolve().parent
+for _path in (
+    _ENGINE_DIR.parent.parent,
+    _ENGINE_DIR / "core" / "prompts",
+    _ENGINE_DIR / "core",
+    _ENGINE_DIR / "shared",
+    _ENGINE_DIR,
+):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from models.request import CashFlowRequest, FinancialAnalysisRequest
+from models.response import CashFlowResponse, FinancialAnalysisResponse
+from agents.cash_flow import generate_cash_flow_async, stream_cash_flow
+from agents.financial_analysis import generate_financial_analysis
 
 # -----------------------------------------------------------------------------
 # Environment & Logging Configuration
@@ -28,6 +51,9 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting Financial Agents API...")
+    # Identical LLM calls (same messages and model settings) are answered from memory.
+    llm_cache_size = int(os.environ.get("LLM_CACHE_SIZE", "1024"))
+    set_llm_cache(InMemoryCache(maxsize=llm_cache_size))
     yield
     logger.info("Shutting down Financial Agents API...")
 
@@ -39,7 +65,11 @@ app = FastAPI(
     description="API for generating cash flow analyses using AI agents",
     version="1.0.0",
     lifespan=lifespan,
-    openapi_tags=[{"name": "cash-flow", "description": "Generate cash flow analysis"}]
+    default_response_class=ORJSONResponse,
+    openapi_tags=[
+        {"name": "cash-flow", "description": "Generate cash flow analysis"},
+        {"name": "financial-analysis", "description": "Generate a comprehensive financial analysis"}
+    ]
 )
 
 # -----------------------------------------------------------------------------
@@ -56,15 +86,25 @@ app.add_middleware(
 # -----------------------------------------------------------------------------
 # Exception Handling
 # -----------------------------------------------------------------------------
+def _json_default(value: Any) -> str:
+    """
+    Fallback for values orjson cannot serialize natively: raw request bodies and
+    the exception instances Pydantic puts in error contexts.
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8", errors="replace")
+    return str(value)
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    return JSONResponse(
+    return Response(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=jsonable_encoder({
+        content=orjson.dumps({
             "detail": exc.errors(),
             "body": exc.body,
             "message": "Invalid request format. Please check your input."
-        })
+        }, default=_json_default),
+        media_type="application/json"
     )
 
 # -----------------------------------------------------------------------------
@@ -73,37 +113,116 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.post(
     "/cash-flow",
     tags=["cash-flow"],
-    response_model=CashFlowResponse,
+    # Documented but not re-validated: the handler returns the serialized body directly.
+    responses={status.HTTP_200_OK: {"model": CashFlowResponse}},
     status_code=status.HTTP_200_OK,
     summary="Generate cash flow analysis",
     description="Creates a cash flow analysis for the provided project details."
 )
-async def analyze_cash_flow(request_body: CashFlowRequest) -> CashFlowResponse:
+async def analyze_cash_flow(request_body: CashFlowRequest) -> ORJSONResponse:
     """
     Generate a cash flow analysis.
 
     - **project_name**: Name of the project (required)
     - **project_description**: Brief description of the project (required)
-    - **industry**: Industry sector of the project (required)
-    - **additional_context**: Any extra information to consider (optional)
+    - **additional_context**: Structured project context (optional); when given, its
+      **industry** is required and market size, timeframe, financial goals, initial
+      investment, project scale and other details may be added
     """
     try:
-        logger.info(f"Received request for cash flow analysis of project: {request_body.project_name}")
-        result: Dict[str, Any] = generate_cash_flow(
+        logger.info("Received request for cash flow analysis of project: %s", request_body.project_name)
+        result: Dict[str, Any] = await generate_cash_flow_async(
             project_name=request_body.project_name,
             project_description=request_body.project_description,
-            industry=request_body.industry,
             additional_context=request_body.additional_context
         )
-        return CashFlowResponse(
+        body = {
+            "project_name": request_body.project_name,
+            "success": result.get("success"),
+            "error": result.get("error"),
+            "intermediate_steps": result.get("intermediate_steps"),
+            # The agent returns its text under "output".
+            "cash_flow_projection": result.get("output"),
+        }
+        # Unset optional fields are omitted rather than sent as null.
+        return ORJSONResponse({key: value for key, value in body.items() if value is not None})
+    except Exception as e:
+        logger.error("Error processing cash flow request: %s", e, exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error processing request: {str(e)}"
+        )
+
+# -----------------------------------------------------------------------------
+# Streaming Cash Flow Endpoint
+# -----------------------------------------------------------------------------
+@app.post(
+    "/cash-flow/stream",
+    tags=["cash-flow"],
+    response_class=StreamingResponse,
+    summary="Stream a cash flow analysis",
+    description="Streams agent progress as Server-Sent Events, ending with the cash flow analysis."
+)
+async def analyze_cash_flow_stream(request_body: CashFlowRequest) -> StreamingResponse:
+    """
+    Stream a cash flow analysis. Each event is a JSON object with a "type" of
+    "action", "observation", "output" or "error".
+
+    - **project_name**: Name of the project (required)
+    - **project_description**: Brief description of the project (required)
+    - **additional_context**: Structured project context (optional); when given, its
+      **industry** is required and market size, timeframe, financial goals, initial
+      investment, project scale and other details may be added
+    """
+    logger.info("Received streaming request for cash flow analysis of project: %s", request_body.project_name)
+
+    async def events():
+        async for event in stream_cash_flow(
             project_name=request_body.project_name,
-            success=result.get("success"),
-            error=result.get("error"),
-            intermediate_steps=result.get("intermediate_steps"),
-            cash_flow_projection=result.get("cash_flow_projection")
+            project_description=request_body.project_description,
+            additional_context=request_body.additional_context
+        ):
+            yield b"data: " + orjson.dumps(event, default=str) + b"\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"}
+    )
+
+# -----------------------------------------------------------------------------
+# Financial Analysis Endpoint
+# -----------------------------------------------------------------------------
+@app.post(
+    "/financial-analysis",
+    tags=["financial-analysis"],
+    response_model=FinancialAnalysisResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_200_OK,
+    summary="Generate comprehensive financial analysis",
+    description="Runs the cash flow, resource planning and revenue modeling agents concurrently."
+)
+async def analyze_financials(request_body: FinancialAnalysisRequest) -> Dict[str, Any]:
+    """
+    Generate a comprehensive financial analysis.
+
+    - **project_name**: Name of the project (required)
+    - **project_description**: Brief description of the project (required)
+    - **additional_context**: Structured project context (optional); when given, its
+      **industry** is required and market size, timeframe, financial goals, initial
+      investment, project scale and other details may be added
+    """
+    try:
+        logger.info("Received request for financial analysis of project: %s", request_body.project_name)
+        result: Dict[str, Any] = await generate_financial_analysis(
+            project_name=request_body.project_name,
+            project_description=request_body.project_description,
+            additional_context=request_body.additional_context
         )
+        # Validated once, against response_model, on the way out.
+        return result
     except Exception as e:
-        logger.error(f"Error processing cash flow request: {str(e)}", exc_info=True)
+        logger.error("Error processing financial analysis request: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"Error processing request: {str(e)}"
@@ -112,7 +231,7 @@ async def analyze_cash_flow(request_body: CashFlowRequest) -> CashFlowResponse:
 # -----------------------------------------------------------------------------
 # Health Check Endpoint (optional)
 # -----------------------------------------------------------------------------
-@app.get("/health", tags=["health"])
+@app.get("/health", tags=["health"], response_model=None)
 async def health_check() -> Dict[str, str]:
     return {"status": "healthy", "service": "Financial Agents API"}
 
@@ -121,4 +240,11 @@ async def health_check() -> Dict[str, str]:
 # -----------------------------------------------------------------------------
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+    )
@@ -1,16 +1,13 @@
 from agentic.finance_engine.shared.base_scheme import BaseFinancialRequest
 
+# The requests share one schema, so they are aliases rather than empty subclasses:
+# Pydantic builds and keeps a single validator for all of them.
 
-class CashFlowRequest(BaseFinancialRequest):
-    """Request model for cash flow analysis."""
-    pass
+# Request model for cash flow analysis.
+CashFlowRequest = BaseFinancialRequest
 
+# Request model for cost estimations.
+EstimationsRequest = BaseFinancialRequest
 
-class EstimationsRequest(BaseFinancialRequest):
-    """Request model for cost estimations."""
-    pass
-
-
-class FinancialAnalysisRequest(BaseFinancialRequest):
-    """Request model for comprehensive financial statements."""
-    pass
+# Request model for comprehensive financial statements.
+FinancialAnalysisRequest = BaseFinancialRequest
@@ -1,9 +1,11 @@
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class EstimationsResponse(BaseModel):
     """Response model for cost estimations."""
+    model_config = ConfigDict(frozen=True)
+
     project_name: str
     success: bool
     cost_estimation: Optional[str] = None
@@ -13,6 +15,8 @@ class EstimationsResponse(BaseModel):
 
 class CashFlowResponse(BaseModel):
     """Response model for cash flow analysis."""
+    model_config = ConfigDict(frozen=True)
+
     project_name: str
     success: bool
     cash_flow_projection: Optional[str] = None
@@ -21,6 +25,8 @@ class CashFlowResponse(BaseModel):
 
 class ResourceAllocationResponse(BaseModel):
     """Response model for resource allocation analysis."""
+    model_config = ConfigDict(frozen=True)
+
     project_name: str
     success: bool
     team_structure: Optional[str] = None
@@ -30,6 +36,8 @@ class ResourceAllocationResponse(BaseModel):
 
 class FinancialAnalysisResponse(BaseModel):
     """Response model for comprehensive financial statements."""
+    model_config = ConfigDict(frozen=True)
+
     project_name: str
     success: bool
     team_structure: Optional[str] = None
@@ -1,17 +1,44 @@
 from abc import ABC, abstractmethod
 import logging
-from typing import Dict, Any, Optional, List
+import os
+import threading
+from functools import cached_property, lru_cache
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
 
 from langchain.agents import AgentExecutor, create_openai_tools_agent
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain.schema import HumanMessage
 from langchain.tools import BaseTool
 
 from config.load_model import get_llm
+from prompts._common import ContextLike
+from shared.micro_batcher import MicroBatcher
+from shared.parallel_executor import ParallelToolAgentExecutor
+from shared.response_cache import ResponseCache
+from tools.yahoo_finance import find_tickers, prefetch, release_prefetched
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _build_prompt(system_prompt: str, static_prompt: Optional[str]) -> ChatPromptTemplate:
+    """
+    Build the agent prompt template, shared by every agent with the same system and
+    static prompts (e.g., the streaming and non-streaming instances of one agent class).
+    """
+    messages = [("system", system_prompt)]
+    if static_prompt:
+        # Sent verbatim (not templated) and ahead of the per-request input, so the
+        # static instructions form a prefix the provider can cache across calls.
+        messages.append(HumanMessage(content=static_prompt))
+    messages += [
+        MessagesPlaceholder(variable_name="chat_history", optional=True),
+        ("human", "{input}"),
+        MessagesPlaceholder(variable_name="agent_scratchpad"),
+    ]
+    return ChatPromptTemplate.from_messages(messages)
+
+
 class BaseAgent(ABC):
     """
     Base Agent class for financial analysis requests.
@@ -19,42 +46,90 @@ class BaseAgent(ABC):
     and enforces structured input formatting.
     """
 
+    # Shared across all agents; keys are scoped per agent class and system prompt.
+    response_cache = ResponseCache(
+        maxsize=int(os.environ.get("AGENT_RESPONSE_CACHE_SIZE", "256")),
+        ttl_seconds=float(os.environ.get("AGENT_RESPONSE_CACHE_TTL_SECONDS", "900"))
+    )
+
+    # Opt-in coalescing window for concurrent async requests. Off by default: the
+    # provider has no multi-prompt endpoint, so a window only adds its own latency
+    # unless many identical requests arrive together.
+    BATCH_WINDOW_SECONDS = int(os.environ.get("AGENT_BATCH_WINDOW_MS", "0")) / 1000
+    BATCH_MAX_CONCURRENCY = int(os.environ.get("AGENT_BATCH_MAX_CONCURRENCY", "10"))
+
+    # Tools exposed to the LLM; subclasses set this as an immutable class-level tuple.
+    TOOLS: Tuple[BaseTool, ...] = ()
+
+    # Process-wide agent pool: one instance per (agent class, streaming flag).
+    _instances: Dict[Tuple[type, bool], "BaseAgent"] = {}
+    _instances_lock = threading.Lock()
+
     def __init__(self, streaming: bool = False):
         self.streaming = streaming
+        logger.info("Registering %d tools for %s.", len(self.tools), type(self).__name__)
         self.agent_executor = self._create_agent()
 
+    @classmethod
+    def shared(cls, streaming: bool = False) -> "BaseAgent":
+        """
+        Return the pooled instance of this agent for the given streaming flag, creating
+        it on first use. Generation keeps no per-request state on the instance, so one
+        agent safely serves concurrent calls.
+
+        Args:
+            streaming (bool): Whether the LLM should stream responses or not.
+
+        Returns:
+            BaseAgent: The shared agent instance.
+        """
+        key = (cls, streaming)
+        agent = cls._instances.get(key)
+        if agent is None:
+            with cls._instances_lock:
+                agent = cls._instances.get(key)
+                if agent is None:
+                    agent = cls._instances[key] = cls(streaming=streaming)
+        return agent
+
     def _create_agent(self) -> AgentExecutor:
         """
         Create an AgentExecutor with the language model, tools, and prompt.
         """
         llm = get_llm(streaming=self.streaming)
-        tools = self.get_tools()
-        system_prompt = self.get_system_prompt()
-
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", system_prompt),
-            MessagesPlaceholder(variable_name="chat_history", optional=True),
-            ("human", "{input}"),
-            MessagesPlaceholder(variable_name="agent_scratchpad"),
-        ])
+        tools = self.tools
+        prompt = _build_prompt(self.get_system_prompt(), self.get_static_prompt())
 
         agent = create_openai_tools_agent(llm, tools, prompt)
-        return AgentExecutor(
+        return ParallelToolAgentExecutor(
             agent=agent,
             tools=tools,
-            verbose=True,
+            verbose=os.environ.get("AGENT_VERBOSE") == "1",
             handle_parsing_errors=True,
             max_iterations=4,
             early_stopping_method="generate",
-            return_intermediate_steps=True
+            # Only streaming agents report the tool trace; see _prepare_response.
+            return_intermediate_steps=self.streaming
         )
 
-    def get_tools(self) -> List[BaseTool]:
+    @cached_property
+    def batcher(self) -> MicroBatcher:
         """
-        Return a list of tools available to the agent.
-        Override in subclass as needed.
+        Micro-batcher that groups concurrent `agenerate` calls into executor batches.
         """
-        return []
+        return MicroBatcher(
+            self.agent_executor,
+            window=self.BATCH_WINDOW_SECONDS,
+            max_concurrency=self.BATCH_MAX_CONCURRENCY
+        )
+
+    @cached_property
+    def tools(self) -> Tuple[BaseTool, ...]:
+        """
+        Return the tools available to the agent, resolved once per instance.
+        Override TOOLS in subclass as needed.
+        """
+        return self.TOOLS
 
     @abstractmethod
     def get_system_prompt(self) -> str:
@@ -63,12 +138,19 @@ class BaseAgent(ABC):
         """
         raise NotImplementedError
 
+    def get_static_prompt(self) -> Optional[str]:
+        """
+        Return the static part of the user prompt, identical across requests.
+        Override in subclass as needed.
+        """
+        return None
+
     @abstractmethod
     def _format_input(
         self,
         project_name: str,
         project_description: str,
-        additional_context: Optional[str] = None
+        additional_context: Optional[ContextLike] = None
     ) -> str:
         """
         Format the input prompt for the agent.
@@ -76,18 +158,45 @@ class BaseAgent(ABC):
         Args:
             project_name (str): Name of the project.
             project_description (str): Brief description of the project.
-            additional_context (Optional[str]): Extra context details.
+            additional_context (Optional[ContextLike]): Extra context details.
 
         Returns:
             str: Formatted input string.
         """
         raise NotImplementedError
 
+    def _cache_key(self, agent_input: str) -> str:
+        """
+        Build the response cache key for a formatted agent input.
+        """
+        return self.response_cache.make_key(
+            type(self).__name__,
+            self.get_system_prompt(),
+            self.streaming,
+            agent_input
+        )
+
+    def _prefetch_tools(self, agent_input: str) -> Tuple[Tuple[str, str], ...]:
+        """
+        Speculatively start the Yahoo Finance lookups the LLM most often requests for
+        every $TICKER mentioned in the input, so they overlap with the first LLM call.
+
+        Args:
+            agent_input (str): The formatted agent input.
+
+        Returns:
+            Tuple[Tuple[str, str], ...]: Prefetch keys to release once generation ends.
+        """
+        tickers = find_tickers(agent_input)
+        if not tickers:
+            return ()
+        return prefetch(tickers, [tool.name for tool in self.tools])
+
     def generate(
         self,
         project_name: str,
         project_description: str,
-        additional_context: Optional[str] = None
+        additional_context: Optional[ContextLike] = None
     ) -> Dict[str, Any]:
         """
         Generate an output based on the project details.
@@ -95,21 +204,166 @@ class BaseAgent(ABC):
         Args:
             project_name (str): Name of the project.
             project_description (str): Project description.
-            additional_context (Optional[str]): Supplementary context in string format.
+            additional_context (Optional[ContextLike]): Supplementary context, as text or a structured model.
+
+        Returns:
+            Dict[str, Any]: Dictionary with generated output and additional info.
+        """
+        try:
+            agent_input = self._format_input(project_name, project_description, additional_context)
+            cache_key = self._cache_key(agent_input)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            logger.info("Generating output for project: %s", project_name)
+            prefetched = self._prefetch_tools(agent_input)
+            try:
+                result = self.agent_executor.invoke({"input": agent_input})
+            finally:
+                release_prefetched(prefetched)
+            output = result.get("output", "")
+            response = self._prepare_response(project_name, output, result, success=True)
+            self.response_cache.set(cache_key, response)
+            return response
+        except Exception as e:
+            logger.error("Error generating output: %s", e, exc_info=True)
+            return self._prepare_error_response(project_name, str(e))
+
+    async def agenerate(
+        self,
+        project_name: str,
+        project_description: str,
+        additional_context: Optional[ContextLike] = None
+    ) -> Dict[str, Any]:
+        """
+        Asynchronously generate an output based on the project details.
+        Mirrors `generate`, but awaits the LLM so several agents can run concurrently.
+
+        Args:
+            project_name (str): Name of the project.
+            project_description (str): Project description.
+            additional_context (Optional[ContextLike]): Supplementary context, as text or a structured model.
 
         Returns:
             Dict[str, Any]: Dictionary with generated output and additional info.
         """
         try:
             agent_input = self._format_input(project_name, project_description, additional_context)
-            logger.info(f"Generating output for project: {project_name}")
-            result = self.agent_executor.invoke({"input": agent_input})
+            cache_key = self._cache_key(agent_input)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            logger.info("Generating output for project: %s", project_name)
+            prefetched = self._prefetch_tools(agent_input)
+            try:
+                if self.BATCH_WINDOW_SECONDS > 0:
+                    result = await self.batcher.submit(agent_input)
+                else:
+                    result = await self.agent_executor.ainvoke({"input": agent_input})
+            finally:
+                release_prefetched(prefetched)
             output = result.get("output", "")
-            return self._prepare_response(project_name, output, result, success=True)
+            response = self._prepare_response(project_name, output, result, success=True)
+            self.response_cache.set(cache_key, response)
+            return response
         except Exception as e:
-            logger.error(f"Error generating output: {str(e)}", exc_info=True)
+            logger.error("Error generating output: %s", e, exc_info=True)
             return self._prepare_error_response(project_name, str(e))
 
+    async def astream(
+        self,
+        project_name: str,
+        project_description: str,
+        additional_context: Optional[ContextLike] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run the agent and yield progress events as they happen: each tool call, each
+        tool result, then the final output. Streamed runs bypass the response cache.
+
+        Args:
+            project_name (str): Name of the project.
+            project_description (str): Project description.
+            additional_context (Optional[ContextLike]): Supplementary context, as text or a structured model.
+
+        Yields:
+            Dict[str, Any]: An event with a "type" of "action", "observation", "output"
+            or "error".
+        """
+        prefetched: Tuple[Tuple[str, str], ...] = ()
+        try:
+            # Inside the try: once the stream has started, failures must arrive as an
+            # "error" event rather than cut the response.
+            agent_input = self._format_input(project_name, project_description, additional_context)
+            logger.info("Streaming output for project: %s", project_name)
+            prefetched = self._prefetch_tools(agent_input)
+            async for chunk in self.agent_executor.astream({"input": agent_input}):
+                for action in chunk.get("actions", ()):
+                    yield {"type": "action", "tool": action.tool, "tool_input": action.tool_input}
+                for step in chunk.get("steps", ()):
+                    yield {"type": "observation", "tool": step.action.tool, "observation": step.observation}
+                if "output" in chunk:
+                    yield {"type": "output", "project_name": project_name, "output": chunk["output"]}
+        except Exception as e:
+            logger.error("Error streaming output: %s", e, exc_info=True)
+            yield {"type": "error", "project_name": project_name, "error": str(e)}
+        finally:
+            release_prefetched(prefetched)
+
+    def run_batch(
+        self,
+        inputs: List[Dict[str, Any]],
+        max_concurrency: int = 4
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate outputs for several projects in one call. Prompts are checked against
+        the response cache first, and the misses are dispatched concurrently through
+        the executor's native batch support. A project whose input cannot be formatted
+        or whose run fails gets an error response; the rest of the batch still runs.
+
+        Args:
+            inputs (List[Dict[str, Any]]): Keyword arguments for `_format_input`, one dict
+                per project. Each dict must contain "project_name".
+            max_concurrency (int): Maximum number of in-flight LLM calls.
+
+        Returns:
+            List[Dict[str, Any]]: One response dictionary per input, in input order.
+        """
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(inputs)
+        # (position in the batch, project name, cache key, formatted input) per miss.
+        pending: List[Tuple[int, str, str, str]] = []
+        for index, kwargs in enumerate(inputs):
+            project_name = kwargs["project_name"]
+            try:
+                agent_input = self._format_input(**kwargs)
+            except Exception as e:
+                logger.error("Error formatting input for project %s: %s", project_name, e)
+                responses[index] = self._prepare_error_response(project_name, str(e))
+                continue
+            cache_key = self._cache_key(agent_input)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                responses[index] = cached
+            else:
+                pending.append((index, project_name, cache_key, agent_input))
+
+        if pending:
+            logger.info("Generating output for a batch of %d projects", len(pending))
+            results = self.agent_executor.batch(
+                [{"input": agent_input} for _, _, _, agent_input in pending],
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True
+            )
+            for (index, project_name, cache_key, _), result in zip(pending, results):
+                if isinstance(result, Exception):
+                    logger.error("Error generating output for project %s: %s", project_name, result)
+                    responses[index] = self._prepare_error_response(project_name, str(result))
+                else:
+                    output = result.get("output", "")
+                    response = self._prepare_response(project_name, output, result, success=True)
+                    self.response_cache.set(cache_key, response)
+                    responses[index] = response
+        return responses
+
     def _prepare_response(
         self,
         project_name: str,
@@ -1,8 +1,11 @@
 from typing import Dict, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 
 
 class AdditionalContext(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
     industry: str = Field(..., description="Industry sector of the project")
     market_size: Optional[str] = Field(None, description="Target market size")
     timeframe: Optional[str] = Field(None, description="Project timeframe")
@@ -15,20 +18,14 @@ class AdditionalContext(BaseModel):
         None, description="Any other relevant information"
     )
 
-    class Config:
-        extra = "allow"
-
-
-class BaseFinancialRequest(BaseModel):
-
-    project_name: str = Field(..., description="Name of the project")
-    project_description: str = Field(..., description="Brief description of the project")
-    additional_context: Optional[AdditionalContext] = Field(
-        None, description="Additional contextual information for the analysis"
-    )
 
-    class Config:
-        schema_extra = {
+# Request models are slotted Pydantic dataclasses rather than BaseModels, so each
+# request instance carries no per-instance __dict__.
+@dataclass(
+    slots=True,
+    config=ConfigDict(
+        extra="ignore",
+        json_schema_extra={
             "example": {
                 "project_name": "EcoTech Smart Home System",
                 "project_description": "IoT-based smart home system focused on energy efficiency and sustainability",
@@ -43,3 +40,12 @@ class BaseFinancialRequest(BaseModel):
                 }
             }
         }
+    )
+)
+class BaseFinancialRequest:
+
+    project_name: str = Field(..., description="Name of the project")
+    project_description: str = Field(..., description="Brief description of the project")
+    additional_context: Optional[AdditionalContext] = Field(
+        None, description="Additional contextual information for the analysis"
+    )
@@ -0,0 +1,82 @@
+import asyncio
+import logging
+from typing import Any, Dict, Set
+
+from langchain.agents import AgentExecutor
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """
+    Coalesces agent inputs submitted within a short window into a single `abatch` call.
+
+    The first submission on an event loop opens a window; everything submitted to that
+    loop before it closes is dispatched together, with at most `max_concurrency` runs
+    in flight. Identical inputs within one window share a single run.
+    """
+
+    def __init__(self, executor: AgentExecutor, window: float = 0.15, max_concurrency: int = 10):
+        self.executor = executor
+        self.window = window
+        self.max_concurrency = max_concurrency
+        # Inputs waiting for the current window, per event loop.
+        self._pending: Dict[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]] = {}
+        # Strong references to the flush tasks so they are not garbage collected mid-run.
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, agent_input: str) -> Dict[str, Any]:
+        """
+        Queue an input for the next batch and wait for its result.
+
+        Args:
+            agent_input (str): The formatted agent input.
+
+        Returns:
+            Dict[str, Any]: The executor result for this input.
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(loop)
+        if pending is None:
+            pending = self._pending[loop] = {}
+            task = loop.create_task(self._flush(loop, pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        future = pending.get(agent_input)
+        if future is None:
+            future = pending[agent_input] = loop.create_future()
+        # Shielded so a cancelled caller does not cancel the run for others awaiting it.
+        return await asyncio.shield(future)
+
+    async def _flush(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        pending: Dict[str, asyncio.Future]
+    ) -> None:
+        """
+        Close the window after `window` seconds and dispatch the collected inputs.
+        """
+        await asyncio.sleep(self.window)
+        # Later submissions open a new window.
+        del self._pending[loop]
+
+        inputs = list(pending)
+        logger.info("Dispatching a batch of %d agent inputs", len(inputs))
+        try:
+            results = await self.executor.abatch(
+                [{"input": agent_input} for agent_input in inputs],
+                config={"max_concurrency": self.max_concurrency},
+                return_exceptions=True
+            )
+        except Exception as e:
+            results = [e] * len(inputs)
+
+        for agent_input, result in zip(inputs, results):
+            future = pending[agent_input]
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -0,0 +1,68 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from langchain.agents import AgentExecutor
+from langchain.callbacks.manager import CallbackManagerForChainRun
+from langchain_core.agents import AgentAction, AgentFinish, AgentStep
+from langchain.tools import BaseTool
+
+# Upper bound on tool calls executed at once for a single agent step.
+MAX_TOOL_WORKERS = 4
+
+# Actions planned in the current step and their precomputed results, per calling thread.
+_step_state = threading.local()
+
+
+class ParallelToolAgentExecutor(AgentExecutor):
+    """
+    AgentExecutor that runs the tool calls of a single step concurrently.
+
+    When the LLM requests several tools in one message, the stock sync executor
+    runs them one after another. The async path (`ainvoke`) already gathers them;
+    this brings `invoke` in line by dispatching them to a small thread pool, so a
+    step takes as long as its slowest tool rather than the sum of all of them.
+    """
+
+    def _iter_next_step(
+        self,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        inputs: Dict[str, str],
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        run_manager: Optional[CallbackManagerForChainRun] = None
+    ) -> Iterator[Union[AgentFinish, AgentAction, AgentStep]]:
+        # The parent yields every planned action before performing the first one,
+        # so by the time _perform_agent_action runs the full step is known.
+        _step_state.actions = []
+        _step_state.steps = {}
+        for item in super()._iter_next_step(
+            name_to_tool_map, color_mapping, inputs, intermediate_steps, run_manager
+        ):
+            if isinstance(item, AgentAction):
+                _step_state.actions.append(item)
+            yield item
+
+    def _perform_agent_action(
+        self,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        agent_action: AgentAction,
+        run_manager: Optional[CallbackManagerForChainRun] = None
+    ) -> AgentStep:
+        perform = super()._perform_agent_action
+        actions = getattr(_step_state, "actions", [])
+        steps = getattr(_step_state, "steps", {})
+
+        if len(actions) > 1 and not steps:
+            with ThreadPoolExecutor(max_workers=min(len(actions), MAX_TOOL_WORKERS)) as pool:
+                results = pool.map(
+                    lambda action: perform(name_to_tool_map, color_mapping, action, run_manager),
+                    actions
+                )
+                steps.update(zip(map(id, actions), results))
+
+        step = steps.pop(id(agent_action), None)
+        if step is None:
+            step = perform(name_to_tool_map, color_mapping, agent_action, run_manager)
+        return step
@@ -0,0 +1,88 @@
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    Thread-safe, bounded LRU cache of agent responses keyed by the normalized prompt.
+    Prompts that differ only in whitespace share an entry; casing is kept, since project
+    names and amounts are case-sensitive. Entries are scoped per agent class, system
+    prompt and streaming flag, so different agents never collide and a streaming agent
+    never receives a response recorded without its intermediate steps.
+
+    Matching is exact after normalization, not by embedding similarity, which would need
+    an embedding model and vector index the engine does not otherwise use. Unlike the
+    process-wide LLM cache, which only replays identical LLM calls, a hit here skips the
+    whole agent run, tool calls included. Responses embed live market data from those
+    tools, so entries expire after `ttl_seconds`.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl_seconds: float = 900.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        # key -> (expiry time, response), in least-recently-used order.
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(agent_name: str, system_prompt: str, streaming: bool, prompt: str) -> str:
+        """
+        Build the cache key for a prompt.
+
+        Args:
+            agent_name (str): Name of the agent class.
+            system_prompt (str): The agent's system prompt.
+            streaming (bool): Whether the agent streams (and reports intermediate steps).
+            prompt (str): The formatted agent input.
+
+        Returns:
+            str: A hex digest identifying the normalized request.
+        """
+        normalized = " ".join(prompt.split())
+        digest = hashlib.sha256()
+        for part in (agent_name, system_prompt, "streaming" if streaming else "", normalized):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the cached response for `key`, or None on a miss or when the
+        entry has expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        logger.info("Response cache hit")
+        return dict(response)
+
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        """
+        Store a response, evicting the least recently used entry when full.
+        """
+        if self.maxsize <= 0 or self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, dict(response))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
@@ -1,15 +1,214 @@
 import os
+import re
 import logging
-import requests
-from typing import List, Dict, Any
+import threading
+import time
+import orjson
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Optional, Tuple
 from langchain.tools import tool
 
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _http_client():
+    """
+    Return the HTTP session shared by all Yahoo Finance tools, created on first use.
+    Every agent module imports these tools, but the HTTP stack is only needed once a
+    tool actually runs. Keep-alive connections are pooled, so consecutive and
+    concurrent tool calls skip the TCP/TLS handshake. Transient gateway errors are
+    retried with backoff; every endpoint is a read-only lookup, POST included.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"})
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Service endpoint templates, relative to YAHOO_FINANCE_PROTOCOL_URL.
+_ENDPOINT_PATHS = {
+    "market": "/yahoo_market",
+    "financials": "/yahoo_market/financials/{}",
+    "sizing": "/market_sizing/{}",
+    "peers": "/industry_peers/{}",
+}
+_endpoint_urls: Optional[Dict[str, str]] = None
+
+
+def _endpoints() -> Optional[Dict[str, str]]:
+    """
+    Return the absolute endpoint URL templates, built the first time
+    YAHOO_FINANCE_PROTOCOL_URL is found set. The variable is read lazily because
+    .env files are loaded after this module is imported; while it is unset this
+    returns None and every call reports it.
+    """
+    global _endpoint_urls
+    if _endpoint_urls is None:
+        protocol_url = os.environ.get('YAHOO_FINANCE_PROTOCOL_URL')
+        if protocol_url:
+            base = protocol_url.rstrip("/")
+            _endpoint_urls = {name: base + path for name, path in _ENDPOINT_PATHS.items()}
+    return _endpoint_urls
+
+
+# Speculative prefetch: results of likely tool calls, fetched while the LLM is still
+# deciding which tools to use. Keyed by (tool name, ticker) and consumed by the first
+# matching tool call; stale entries are dropped after _PREFETCH_TTL_SECONDS.
+_PREFETCH_TTL_SECONDS = 300
+_prefetched: Dict[Tuple[str, str], Tuple[float, Future]] = {}
+_prefetch_lock = threading.Lock()
+
+# Explicit ticker mentions in free text, written as cashtags (e.g. "$AAPL", "$BRK.B").
+_CASHTAG = re.compile(r"\$([A-Z]{1,5}(?:\.[A-Z]{1,2})?)\b")
+
+
+@lru_cache(maxsize=1)
+def _prefetch_pool() -> ThreadPoolExecutor:
+    """
+    Return the worker pool for speculative prefetches, created on first use.
+    """
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="yahoo-prefetch")
+
+
+def find_tickers(text: str) -> Tuple[str, ...]:
+    """
+    Extract the distinct cashtag tickers mentioned in a text, in order of appearance.
+
+    Args:
+        text: Free text such as a formatted agent prompt.
+
+    Returns:
+        Tuple of ticker symbols without the leading "$".
+    """
+    return tuple(dict.fromkeys(_CASHTAG.findall(text)))
+
+
+def prefetch(tickers: Iterable[str], tool_names: Iterable[str]) -> Tuple[Tuple[str, str], ...]:
+    """
+    Start fetching the prefetchable tools among `tool_names` for each ticker in the
+    background. A later call to the same tool with the same ticker returns the
+    prefetched result, waiting for it if it is still in flight.
+
+    Args:
+        tickers: Ticker symbols to prefetch.
+        tool_names: Names of the tools the calling agent exposes.
+
+    Returns:
+        The (tool name, ticker) keys scheduled by this call, for `release_prefetched`.
+    """
+    fetchers = [(name, _PREFETCHERS[name]) for name in tool_names if name in _PREFETCHERS]
+    now = time.monotonic()
+    scheduled = []
+    with _prefetch_lock:
+        for key in [key for key, (started, _) in _prefetched.items() if now - started > _PREFETCH_TTL_SECONDS]:
+            _prefetched.pop(key)[1].cancel()
+        for ticker in tickers:
+            for name, fetch in fetchers:
+                key = (name, ticker)
+                if key not in _prefetched:
+                    _prefetched[key] = (now, _prefetch_pool().submit(fetch, ticker))
+                    scheduled.append(key)
+    if scheduled:
+        logger.info("Prefetching %d Yahoo Finance lookups.", len(scheduled))
+    return tuple(scheduled)
+
+
+def release_prefetched(keys: Iterable[Tuple[str, str]]) -> None:
+    """
+    Drop prefetched results that were never used, cancelling those not yet started.
+
+    Args:
+        keys: Keys returned by `prefetch`.
+    """
+    with _prefetch_lock:
+        for key in keys:
+            entry = _prefetched.pop(key, None)
+            if entry is not None:
+                entry[1].cancel()
+
+
+def _take_prefetched(tool_name: str, ticker: str) -> Optional[Any]:
+    """
+    Consume the prefetched result for a tool call, if one is available.
+    """
+    with _prefetch_lock:
+        entry = _prefetched.pop((tool_name, ticker), None)
+    if entry is None or entry[1].cancelled():
+        return None
+    if time.monotonic() - entry[0] > _PREFETCH_TTL_SECONDS:
+        return None
+    return entry[1].result()
+
+
+def _call_service(
+    endpoint: str,
+    ticker: str,
+    description: str,
+    method: str = "GET",
+    **request_kwargs: Any
+) -> Any:
+    """
+    Call a Yahoo Finance service endpoint for a ticker and decode the JSON response.
+    Failures are logged and returned as an error dict rather than raised, so the agent
+    can see what went wrong.
+
+    Args:
+        endpoint: Key of the endpoint in `_ENDPOINT_PATHS`.
+        ticker: The stock ticker symbol, also substituted into the endpoint path.
+        description: What is being fetched, for log and error messages.
+        method: HTTP method.
+        **request_kwargs: Passed through to the session request (params, json).
+
+    Returns:
+        The decoded response, or a dict with "error" and "ticker".
+    """
+    logger.info("Fetching %s for: %s", description, ticker)
+    endpoints = _endpoints()
+    if endpoints is None:
+        error_msg = "YAHOO_FINANCE_PROTOCOL_URL environment variable not set"
+        logger.error(error_msg)
+        return {"error": error_msg, "ticker": ticker}
+    try:
+        response = _http_client().request(
+            method,
+            endpoints[endpoint].format(ticker),
+            timeout=30,
+            **request_kwargs
+        )
+        if response.status_code == 200:
+            return orjson.loads(response.content)
+        error_msg = f"Failed to get {description}. Status code: {response.status_code}"
+    except Exception as e:
+        error_msg = f"Error calling Yahoo Finance service: {e}"
+    logger.error(error_msg)
+    return {"error": error_msg, "ticker": ticker}
+
+
+def _fetch_market_data(ticker: str) -> Dict[str, Any]:
+    """
+    Call the Yahoo Finance service for market data.
+    """
+    market_data = _call_service("market", ticker, "market data", "POST", json={"ticker": ticker})
+    # The service reports lookup failures in the response body.
+    if isinstance(market_data, dict) and "error" in market_data:
+        logger.error("Error in response: %s", market_data.get("error"))
+    return market_data
+
+
 @tool
 def yahoo_finance_market_data(ticker: str) -> Dict[str, Any]:
     """
@@ -22,34 +221,8 @@ def yahoo_finance_market_data(ticker: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing comprehensive market data for the specified company.
     """
-    try:
-        logger.info(f"Fetching Yahoo Finance market data for: {ticker}")
-        protocol_url = os.environ.get('YAHOO_FINANCE_PROTOCOL_URL')
-        if not protocol_url:
-            error_msg = "YAHOO_FINANCE_PROTOCOL_URL environment variable not set"
-            logger.error(error_msg)
-            return {"error": error_msg, "ticker": ticker}
-
-        response = requests.post(
-            f"{protocol_url}/yahoo_market",
-            json={"ticker": ticker},
-            timeout=30
-        )
-        if response.status_code == 200:
-            market_data = response.json()
-            # Check if the response contains error data
-            if isinstance(market_data, dict) and "error" in market_data:
-                logger.error(f"Error in response: {market_data.get('error')}")
-                return market_data
-            return market_data
-        else:
-            error_msg = f"Failed to get market data. Status code: {response.status_code}"
-            logger.error(error_msg)
-            return {"error": error_msg, "ticker": ticker}
-    except Exception as e:
-        error_msg = f"Error calling Yahoo Finance service: {str(e)}"
-        logger.error(error_msg)
-        return {"error": error_msg, "ticker": ticker}
+    prefetched = _take_prefetched("yahoo_finance_market_data", ticker)
+    return prefetched if prefetched is not None else _fetch_market_data(ticker)
 
 
 @tool
@@ -64,28 +237,14 @@ def yahoo_finance_financials(ticker: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing financial statement data.
     """
-    try:
-        logger.info(f"Fetching financial statements for: {ticker}")
-        protocol_url = os.environ.get('YAHOO_FINANCE_PROTOCOL_URL')
-        if not protocol_url:
-            error_msg = "YAHOO_FINANCE_PROTOCOL_URL environment variable not set"
-            logger.error(error_msg)
-            return {"error": error_msg, "ticker": ticker}
-
-        response = requests.get(
-            f"{protocol_url}/yahoo_market/financials/{ticker}",
-            timeout=30
-        )
-        if response.status_code == 200:
-            return response.json()
-        else:
-            error_msg = f"Failed to get financial data. Status code: {response.status_code}"
-            logger.error(error_msg)
-            return {"error": error_msg, "ticker": ticker}
-    except Exception as e:
-        error_msg = f"Error calling Yahoo Finance service: {str(e)}"
-        logger.error(error_msg)
-        return {"error": error_msg, "ticker": ticker}
+    return _call_service("financials", ticker, "financial data")
+
+
+def _fetch_market_sizing(ticker: str) -> Dict[str, Any]:
+    """
+    Call the Yahoo Finance service for market sizing data.
+    """
+    return _call_service("sizing", ticker, "market sizing data")
 
 
 @tool
@@ -100,28 +259,8 @@ def yahoo_market_sizing(ticker: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing market sizing data.
     """
-    try:
-        logger.info(f"Fetching market sizing data for: {ticker}")
-        protocol_url = os.environ.get('YAHOO_FINANCE_PROTOCOL_URL')
-        if not protocol_url:
-            error_msg = "YAHOO_FINANCE_PROTOCOL_URL environment variable not set"
-            logger.error(error_msg)
-            return {"error": error_msg, "ticker": ticker}
-
-        response = requests.get(
-            f"{protocol_url}/market_sizing/{ticker}",
-            timeout=30
-        )
-        if response.status_code == 200:
-            return response.json()
-        else:
-            error_msg = f"Failed to get market sizing data. Status code: {response.status_code}"
-            logger.error(error_msg)
-            return {"error": error_msg, "ticker": ticker}
-    except Exception as e:
-        error_msg = f"Error calling Yahoo Finance service: {str(e)}"
-        logger.error(error_msg)
-        return {"error": error_msg, "ticker": ticker}
+    prefetched = _take_prefetched("yahoo_market_sizing", ticker)
+    return prefetched if prefetched is not None else _fetch_market_sizing(ticker)
 
 
 @tool
@@ -137,26 +276,20 @@ def yahoo_industry_peers(ticker: str, limit: int = 5) -> List[Dict[str, Any]]:
     Returns:
         List of peer companies with basic financial metrics.
     """
-    try:
-        logger.info(f"Fetching industry peers for: {ticker}")
-        protocol_url = os.environ.get('YAHOO_FINANCE_PROTOCOL_URL')
-        if not protocol_url:
-            error_msg = "YAHOO_FINANCE_PROTOCOL_URL environment variable not set"
-            logger.error(error_msg)
-            return [{"error": error_msg, "ticker": ticker}]
-
-        response = requests.get(
-            f"{protocol_url}/industry_peers/{ticker}",
-            params={"limit": limit},
-            timeout=30
-        )
-        if response.status_code == 200:
-            return response.json()
-        else:
-            error_msg = f"Failed to get industry peers. Status code: {response.status_code}"
-            logger.error(error_msg)
-            return [{"error": error_msg, "ticker": ticker}]
-    except Exception as e:
-        error_msg = f"Error calling Yahoo Finance service: {str(e)}"
-        logger.error(error_msg)
-        return [{"error": error_msg, "ticker": ticker}]
+    peers = _call_service("peers", ticker, "industry peers", params={"limit": limit})
+    return [peers] if isinstance(peers, dict) else peers
+
+
+# Default tool set shared by the finance agents.
+YAHOO_FINANCE_TOOLS = (
+    yahoo_finance_market_data,
+    yahoo_finance_financials,
+    yahoo_market_sizing,
+    yahoo_industry_peers
+)
+
+# Tools whose results are worth fetching speculatively, by tool name.
+_PREFETCHERS = {
+    yahoo_finance_market_data.name: _fetch_market_data,
+    yahoo_market_sizing.name: _fetch_market_sizing,
+}
@@ -1,10 +1,16 @@
 import os
+import time
 import logging
-from typing import Dict, Any, List
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
+
+import orjson
 
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 import uvicorn
 
 from finance_service import YahooFinanceService
@@ -20,11 +26,46 @@ logger = logging.getLogger(__name__)
 # Create the Yahoo Finance service instance
 yahoo_service = YahooFinanceService()
 
+# Serialized body of the latest result per request, with the result it was built from.
+# The service returns the same cached object until its TTL expires, so the body is
+# reused for as long as the result is; a recomputed result is serialized afresh. The
+# entry keeps the result alive so the identity check cannot match a recycled object,
+# and expires with the service TTL so expired results are released. Entries are kept
+# in expiry order (hits do not reorder them), so expired ones are pruned from the front.
+_SERIALIZED_TTL_SECONDS = float(os.environ.get("YF_CACHE_TTL_SECONDS", "900"))
+_SERIALIZED_MAXSIZE = int(os.environ.get("YF_CACHE_MAXSIZE", "1024"))
+_serialized: "OrderedDict[Tuple[Any, ...], Tuple[Any, float, bytes]]" = OrderedDict()
+
+
+def _json_response(key: Tuple[Any, ...], result: Any) -> Response:
+    """
+    Return a service result as JSON, serializing it only if it changed since the last
+    request with the same key. Only called from the event loop, so no lock is needed.
+    """
+    now = time.monotonic()
+    while _serialized and next(iter(_serialized.values()))[1] <= now:
+        _serialized.popitem(last=False)
+    entry = _serialized.get(key)
+    if entry is not None and entry[0] is result:
+        body = entry[2]
+    else:
+        body = orjson.dumps(
+            result,
+            default=str,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+        _serialized[key] = (result, now + _SERIALIZED_TTL_SECONDS, body)
+        _serialized.move_to_end(key)
+        while len(_serialized) > _SERIALIZED_MAXSIZE:
+            _serialized.popitem(last=False)
+    return Response(content=body, media_type="application/json")
+
 # Create FastAPI application
 app = FastAPI(
     title="Yahoo Finance Market Data Service",
     description="A service for retrieving market data from Yahoo Finance for financial projections and market analysis",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     openapi_tags=[{"name": "finance", "description": "Financial data endpoints"}]
 )
 
@@ -37,59 +78,64 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
+# Financial statement payloads run to tens of KB of JSON; compress them on the wire.
+# The tools' requests session asks for gzip by default and decodes it transparently.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Global exception handler for unhandled exceptions
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error", "message": str(exc)}
     )
 
-@app.post("/yahoo_market", tags=["finance"])
-async def yahoo_market_data(ticker: str) -> Dict[str, Any]:
+@app.post("/yahoo_market", tags=["finance"], response_model=Dict[str, Any])
+async def yahoo_market_data(ticker: str) -> Response:
     """
     Retrieve comprehensive financial and market data for a ticker symbol.
     """
     logger.info(f"Processing market data request for ticker: {ticker}")
     try:
-        # Retrieve and return all market data; data is sanitized in the service
-        result = yahoo_service.get_all_market_data(ticker)
-        return result
+        # Retrieve and return all market data; data is sanitized in the service.
+        # yfinance blocks on network I/O, so service calls run off the event loop.
+        result = await run_in_threadpool(yahoo_service.get_all_market_data, ticker)
+        return _json_response(("market", ticker), result)
     except Exception as e:
         logger.error(f"Error retrieving market data for {ticker}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error retrieving market data: {str(e)}")
 
-@app.get("/yahoo_market_financials/{ticker}", tags=["finance"])
-async def get_financials(ticker: str) -> Dict[str, Any]:
+@app.get("/yahoo_market_financials/{ticker}", tags=["finance"], response_model=Dict[str, Any])
+async def get_financials(ticker: str) -> Response:
     """
     Get detailed financial statements for a ticker.
     """
     logger.info(f"Retrieving financial data for {ticker}")
     try:
-        result = yahoo_service.get_financial_data(ticker)
-        return result
+        result = await run_in_threadpool(yahoo_service.get_financial_data, ticker)
+        return _json_response(("financials", ticker), result)
     except Exception as e:
         logger.error(f"Error retrieving financials for {ticker}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error retrieving financial data: {str(e)}")
 
-@app.get("/market_sizing/{ticker}", tags=["finance"])
-async def get_market_sizing(ticker: str) -> Dict[str, Any]:
+@app.get("/market_sizing/{ticker}", tags=["finance"], response_model=Dict[str, Any])
+async def get_market_sizing(ticker: str) -> Response:
     """
     Get market sizing estimates (TAM, SAM, SOM) for a ticker.
     """
     logger.info(f"Retrieving market sizing data for {ticker}")
     try:
-        result = yahoo_service.get_market_share_data(ticker)
+        result = await run_in_threadpool(yahoo_service.get_market_share_data, ticker)
         if "error" in result:
             logger.warning(f"Warning for ticker {ticker}: {result.get('error')}")
-        return result
+        return _json_response(("sizing", ticker), result)
     except Exception as e:
         logger.error(f"Error retrieving market sizing for {ticker}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error retrieving market sizing data: {str(e)}")
 
-@app.get("/industry_peers/{ticker}", tags=["finance"])
-async def get_industry_peers(ticker: str, limit: int = 5) -> List[Dict[str, Any]]:
+@app.get("/industry_peers/{ticker}", tags=["finance"], response_model=List[Dict[str, Any]])
+async def get_industry_peers(ticker: str, limit: int = 5) -> Response:
     """
     Get information about industry peers (competitors) for market comparison.
 
@@ -99,8 +145,8 @@ async def get_industry_peers(ticker: str, limit: int = 5) -> List[Dict[str, Any]
     """
     logger.info(f"Retrieving industry peers for {ticker} with limit {limit}")
     try:
-        result = yahoo_service.get_industry_peers(ticker, limit)
-        return result
+        result = await run_in_threadpool(yahoo_service.get_industry_peers, ticker, limit)
+        return _json_response(("peers", ticker, limit), result)
     except Exception as e:
         logger.error(f"Error retrieving industry peers for {ticker}: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Error retrieving industry peers: {str(e)}")
@@ -113,4 +159,11 @@ async def health_check() -> Dict[str, str]:
     return {"status": "healthy", "service": "yahoo-finance-market-data"}
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("WEB_CONCURRENCY", "4"))
+    )
@@ -1,15 +1,297 @@
+import os
 import math
+import time
 import logging
-import numpy as np
-import pandas as pd
-import yfinance as yf
-from typing import Dict, Any, List, Union
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, wraps
+from typing import TYPE_CHECKING, Callable, Dict, Any, List, Optional, Tuple, TypeVar, Union
+
+# numpy, pandas and yfinance are imported on first use: a worker serving from the
+# cache never pays for them, and worker startup is hundreds of milliseconds faster.
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+    import yfinance as yf
 
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Yahoo data changes slowly relative to request rates; lookups are reused for this long.
+_CACHE_TTL_SECONDS = float(os.environ.get("YF_CACHE_TTL_SECONDS", "900"))
+_CACHE_MAXSIZE = int(os.environ.get("YF_CACHE_MAXSIZE", "1024"))
+
+# (method name, *args) -> (expiry time, result), in least-recently-used order.
+_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+# Lookups currently running, by cache key; concurrent identical calls wait on these.
+_inflight: Dict[Tuple[Any, ...], Future] = {}
+
+# (result key, Yahoo info key) for the metrics returned by get_estimation_data.
+_ESTIMATION_KEYS = (
+    ("previous_close", "previousClose"),
+    ("open", "open"),
+    ("bid", "bid"),
+    ("ask", "ask"),
+    ("volume", "volume"),
+    ("market_cap", "marketCap"),
+    ("trailing_PE", "trailingPE"),
+    ("forward_PE", "forwardPE"),
+    ("price_to_book", "priceToBook"),
+    ("dividend_yield", "dividendYield"),
+    ("earnings_growth", "earningsGrowth"),
+    ("revenue_growth", "revenueGrowth"),
+)
+
+# Upper bound on concurrent peer lookups for a single ticker.
+_PEER_FETCH_WORKERS = 8
+
+
+def _is_error_payload(value: Any) -> bool:
+    if isinstance(value, dict):
+        return "error" in value
+    if isinstance(value, list):
+        return any(isinstance(item, dict) and "error" in item for item in value)
+    return False
+
+
+def _is_error(result: Any) -> bool:
+    """
+    Whether a service result is an error payload, or a bundle with a failed part, which
+    must not be cached.
+    """
+    if _is_error_payload(result):
+        return True
+    return isinstance(result, dict) and any(_is_error_payload(part) for part in result.values())
+
+
+def _ttl_cached(method: F) -> F:
+    """
+    Cache a service method's successful results per (method, arguments) for
+    `_CACHE_TTL_SECONDS`. Concurrent identical calls on a miss share one upstream
+    fetch. Calls passing anything but plain str/int arguments (such as a shared Ticker)
+    bypass the cache. Cached results are shared between callers and must be treated
+    as read-only.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        params = args + tuple(kwargs[name] for name in sorted(kwargs))
+        if not all(isinstance(param, (str, int)) for param in params):
+            return method(self, *args, **kwargs)
+
+        key = (method.__name__,) + args + tuple(sorted(kwargs.items()))
+        now = time.monotonic()
+        with _cache_lock:
+            entry = _cache.get(key)
+            if entry is not None and entry[0] > now:
+                _cache.move_to_end(key)
+                return entry[1]
+            inflight = _inflight.get(key)
+            if inflight is None:
+                inflight = _inflight[key] = Future()
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            return inflight.result()
+
+        try:
+            result = method(self, *args, **kwargs)
+        except BaseException as e:
+            with _cache_lock:
+                del _inflight[key]
+            inflight.set_exception(e)
+            raise
+        with _cache_lock:
+            del _inflight[key]
+            if not _is_error(result):
+                _cache[key] = (now + _CACHE_TTL_SECONDS, result)
+                _cache.move_to_end(key)
+                while len(_cache) > _CACHE_MAXSIZE:
+                    _cache.popitem(last=False)
+        inflight.set_result(result)
+        return result
+
+    return wrapper
+
+
+class _Sanitized:
+    """
+    Marks a subtree that is already JSON-safe, so `_sanitize_data` returns it without
+    walking it again.
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+def _scrub_float(value: float) -> Optional[float]:
+    return value if math.isfinite(value) else None
+
+
+# The container sanitizers are copy-on-write: a clean container is returned as is, with
+# no allocation, and one that needs changes is copied from its first changed entry on.
+# Inputs are never mutated, since they may be yfinance's cached info or a result
+# shared through the TTL cache.
+def _scrub_dict(data: Dict[Any, Any]) -> Dict[Any, Any]:
+    items = iter(data.items())
+    for key, value in items:
+        cleaned = _sanitize(value)
+        if cleaned is not value:
+            break
+    else:
+        return data
+    result = dict(data)
+    result[key] = cleaned
+    for key, value in items:
+        cleaned = _sanitize(value)
+        if cleaned is not value:
+            result[key] = cleaned
+    return result
+
+
+def _scrub_list(data: List[Any]) -> List[Any]:
+    for index, item in enumerate(data):
+        cleaned = _sanitize(item)
+        if cleaned is not item:
+            break
+    else:
+        return data
+    result = data[:index]
+    result.append(cleaned)
+    result.extend(_sanitize(item) for item in data[index + 1:])
+    return result
+
+
+def _json_labels(labels: "pd.Index") -> "pd.Index":
+    """
+    Return frame labels usable as JSON object keys. Statement columns are period
+    Timestamps, which orjson rejects as keys; they become ISO 8601 strings, as the
+    JSON encoder rendered them before.
+    """
+    import pandas as pd
+
+    if isinstance(labels, pd.DatetimeIndex):
+        return pd.Index([label.isoformat() for label in labels], dtype=object)
+    return labels
+
+
+def _scrub_frame(data: Union["pd.DataFrame", "pd.Series"]) -> Dict[Any, Any]:
+    import numpy as np
+    import pandas as pd
+
+    index = _json_labels(data.index)
+    values = data.to_numpy()
+    if values.dtype.kind == "f":
+        # All-float block (the usual shape of a statement): one np.where pass in C.
+        # The object result holds plain Python floats and None, so to_dict needs no
+        # further walk.
+        cleaned = np.where(np.isfinite(values), values, None)
+        if isinstance(data, pd.DataFrame):
+            return pd.DataFrame(cleaned, index=index, columns=_json_labels(data.columns)).to_dict()
+        return pd.Series(cleaned, index=index, name=data.name).to_dict()
+    # Mixed dtypes: scrub NaN and infinities column-wise through pandas. replace()
+    # returns a new frame, so relabelling it leaves the caller's data untouched.
+    finite = data.replace([np.inf, -np.inf], np.nan)
+    finite.index = index
+    if isinstance(finite, pd.DataFrame):
+        finite.columns = _json_labels(finite.columns)
+    return finite.astype(object).where(finite.notna(), None).to_dict()
+
+
+def _scrub_ndarray(data: "np.ndarray") -> List[Any]:
+    import numpy as np
+
+    if data.dtype.kind == "f":
+        return np.where(np.isfinite(data), data, None).tolist()
+    return _sanitize(data.tolist())
+
+
+def _scrub_scalar(value: Any) -> Any:
+    return None if isinstance(value, float) and not math.isfinite(value) else value
+
+
+def _passthrough(data: Any) -> Any:
+    return data
+
+
+# Sanitizer per exact type, so each node costs one dict lookup instead of a chain of
+# isinstance checks. Common JSON-safe leaves are listed to stay on the fast path.
+# The pandas and numpy entries are added by _yf(), since only yfinance produces them.
+_SANITIZERS: Dict[type, Callable[[Any], Any]] = {
+    str: _passthrough,
+    int: _passthrough,
+    bool: _passthrough,
+    type(None): _passthrough,
+    float: _scrub_float,
+    dict: _scrub_dict,
+    list: _scrub_list,
+    _Sanitized: lambda data: data.value,
+}
+
+
+def _sanitize(data: Any) -> Any:
+    """
+    Replace NaN and infinite floats with None throughout a data structure.
+    """
+    sanitizer = _SANITIZERS.get(type(data))
+    if sanitizer is not None:
+        return sanitizer(data)
+    # Subclasses of the handled types, such as numpy.float64 or an OrderedDict. The
+    # table is copied because _yf() may be extending it from another thread.
+    for base, sanitizer in list(_SANITIZERS.items()):
+        if sanitizer is not _passthrough and isinstance(data, base):
+            return sanitizer(data)
+    return data
+
+
+@lru_cache(maxsize=1)
+def _yf():
+    """
+    Import yfinance on first use and register the sanitizers for the pandas and numpy
+    objects it returns.
+    """
+    import numpy as np
+    import pandas as pd
+    import yfinance
+
+    _SANITIZERS.update({
+        pd.DataFrame: _scrub_frame,
+        pd.Series: _scrub_frame,
+        np.ndarray: _scrub_ndarray,
+    })
+    return yfinance
+
+
+@lru_cache(maxsize=1)
+def _yf_session():
+    """
+    Return the HTTP session shared by every Ticker, so Yahoo lookups reuse pooled
+    keep-alive connections instead of paying a TLS handshake each. curl_cffi (a
+    yfinance dependency) impersonates a browser, which Yahoo rate-limits less
+    aggressively; yfinance versions without it fall back to their own session.
+    """
+    try:
+        from curl_cffi import requests as curl_requests
+    except ImportError:
+        return None
+    return curl_requests.Session(impersonate="chrome")
+
+
+def _ticker(symbol: str) -> "yf.Ticker":
+    """
+    Create a Ticker for a symbol on the shared session.
+    """
+    return _yf().Ticker(symbol, session=_yf_session())
+
 
 class YahooFinanceService:
     """
@@ -29,26 +311,22 @@ class YahooFinanceService:
         Returns:
             The sanitized data structure.
         """
-        if isinstance(data, float):
-            if math.isnan(data) or math.isinf(data):
-                return None
-            return data
-        elif isinstance(data, dict):
-            return {k: self._sanitize_data(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [self._sanitize_data(item) for item in data]
-        elif isinstance(data, pd.DataFrame):
-            # Replace NaN values with None and convert DataFrame to dict
-            data_dict = data.where(pd.notna(data), None).to_dict()
-            return self._sanitize_data(data_dict)
-        elif isinstance(data, pd.Series):
-            # Replace NaN values with None and convert Series to dict
-            data_dict = data.where(pd.notna(data), None).to_dict()
-            return self._sanitize_data(data_dict)
-        elif isinstance(data, np.ndarray):
-            data_list = data.tolist()
-            return self._sanitize_data(data_list)
-        return data
+        return _sanitize(data)
+
+    def _statement_to_dict(self, statement: Optional["pd.DataFrame"]) -> _Sanitized:
+        """
+        Convert a financial statement DataFrame to a dict in a single sanitizing pass.
+
+        Args:
+            statement: The statement as returned by yfinance, possibly None or empty.
+
+        Returns:
+            The statement as a sanitized dict (empty if there is no data), marked so the
+            enclosing result is not re-scrubbed.
+        """
+        if statement is None or statement.empty:
+            return _Sanitized({})
+        return _Sanitized(self._sanitize_data(statement))
 
     def get_market_share_data(self, ticker: str) -> Dict[str, Any]:
         """
@@ -63,6 +341,21 @@ class YahooFinanceService:
         # Stub: Return an empty dict or implement your logic
         return {}
 
+    def _fetch_bundle(self, ticker: str) -> Tuple["yf.Ticker", Dict[str, Any]]:
+        """
+        Create the Ticker for a symbol and fetch its `.info` once, so a request that
+        needs both statements and info-derived data pays for a single info round trip.
+
+        Args:
+            ticker: The stock ticker symbol.
+
+        Returns:
+            The Ticker and its info dict.
+        """
+        stock = _ticker(ticker)
+        return stock, stock.info or {}
+
+    @_ttl_cached
     def get_all_market_data(self, ticker: str) -> Dict[str, Any]:
         """
         Get comprehensive financial and market data for a ticker.
@@ -75,59 +368,132 @@ class YahooFinanceService:
         """
         try:
             logger.info(f"Fetching comprehensive market data for {ticker}")
-            stock = yf.Ticker(ticker)
-            result = {
-                "info": stock.info,
-                "market_share": self.get_market_share_data(ticker),
-                "financials": self.get_financial_data(ticker),
-                "peers": self.get_industry_peers(ticker)
-            }
-            return self._sanitize_data(result)
+            stock, info = self._fetch_bundle(ticker)
+            # Each part is an independent Yahoo round trip, so fetch them concurrently.
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                market_share = pool.submit(self.get_market_share_data, ticker)
+                financials = pool.submit(self.get_financial_data, ticker, stock, info)
+                peers = pool.submit(self._peers_or_error, ticker, info, 5)
+                # get_financial_data returns an already-sanitized result; only the raw
+                # parts are scrubbed, so the statements are not walked a second time.
+                return {
+                    "info": self._sanitize_data(info),
+                    "market_share": self._sanitize_data(market_share.result()),
+                    "financials": financials.result(),
+                    "peers": self._sanitize_data(peers.result())
+                }
         except Exception as e:
             logger.error(f"Error fetching market data for {ticker}: {str(e)}", exc_info=True)
             return {"error": str(e), "ticker": ticker}
 
-    def get_financial_data(self, ticker: str) -> Dict[str, Any]:
+    @_ttl_cached
+    def get_financial_data(
+        self,
+        ticker: str,
+        stock: Optional["yf.Ticker"] = None,
+        info: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Get financial statements for a ticker.
 
         Args:
             ticker: The stock ticker symbol.
+            stock: An existing Ticker for `ticker`, to share with the caller.
+            info: The Ticker's already-fetched info; fetched here if omitted.
 
         Returns:
             A dictionary containing financial statement data.
         """
         try:
             logger.info(f"Fetching financial data for {ticker}")
-            stock = yf.Ticker(ticker)
-
-            # Income Statement
-            income_stmt = {}
-            if hasattr(stock, 'income_stmt') and stock.income_stmt is not None and not stock.income_stmt.empty:
-                income_stmt = stock.income_stmt.where(pd.notna(stock.income_stmt), None).to_dict()
-
-            # Balance Sheet
-            balance_sheet = {}
-            if hasattr(stock, 'balance_sheet') and stock.balance_sheet is not None and not stock.balance_sheet.empty:
-                balance_sheet = stock.balance_sheet.where(pd.notna(stock.balance_sheet), None).to_dict()
-
-            # Cash Flow
-            cash_flow = {}
-            if hasattr(stock, 'cashflow') and stock.cashflow is not None and not stock.cashflow.empty:
-                cash_flow = stock.cashflow.where(pd.notna(stock.cashflow), None).to_dict()
-
-            result = {
-                "income_statement": income_stmt,
-                "balance_sheet": balance_sheet,
-                "cash_flow": cash_flow,
-                "key_metrics": self.get_estimation_data(ticker),
-                "resource_data": self.get_resource_allocation_data(ticker)
-            }
+            if stock is None:
+                stock = _ticker(ticker)
+
+            # The statements (and info, if needed) are separate requests; run them concurrently.
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                futures = {
+                    "income_statement": pool.submit(
+                        lambda: self._statement_to_dict(getattr(stock, "income_stmt", None))
+                    ),
+                    "balance_sheet": pool.submit(
+                        lambda: self._statement_to_dict(getattr(stock, "balance_sheet", None))
+                    ),
+                    "cash_flow": pool.submit(
+                        lambda: self._statement_to_dict(getattr(stock, "cashflow", None))
+                    ),
+                }
+                if info is None:
+                    info = pool.submit(lambda: stock.info or {}).result()
+                result = {key: future.result() for key, future in futures.items()}
+            result["key_metrics"] = self._estimation_from_info(info)
+            result["resource_data"] = self._resource_from_info(info)
             return self._sanitize_data(result)
         except Exception as e:
             logger.error(f"Error fetching financial data for {ticker}: {str(e)}", exc_info=True)
             return {"error": str(e), "ticker": ticker}
 
+    def _fetch_peer_info(self, peer_ticker: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up the summary fields of a single peer.
+
+        Args:
+            peer_ticker: The peer's ticker symbol.
+
+        Returns:
+            The peer's data, or None if the lookup failed.
+        """
+        try:
+            peer_info = _ticker(peer_ticker).info
+            return {
+                "ticker": peer_ticker,
+                "name": peer_info.get("shortName"),
+                "sector": peer_info.get("sector"),
+                "industry": peer_info.get("industry"),
+                "market_cap": peer_info.get("marketCap")
+            }
+        except Exception as peer_err:
+            logger.warning("Error getting data for peer ticker %s: %s", peer_ticker, peer_err)
+            return None
+
+    def _peers_from_info(self, info: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+        """
+        Look up the peers recommended in a ticker's info.
+
+        Args:
+            info: The ticker's info dict.
+            limit: Maximum number of peers to return.
+
+        Returns:
+            A list of dictionaries containing peer data, in recommendation order.
+        """
+        peer_tickers = info.get("recommendedSymbols", [])[:limit]
+        if not peer_tickers:
+            return []
+        # One info round trip per peer; run them concurrently.
+        with ThreadPoolExecutor(max_workers=min(_PEER_FETCH_WORKERS, len(peer_tickers))) as pool:
+            peers = list(pool.map(self._fetch_peer_info, peer_tickers))
+        return [peer for peer in peers if peer is not None]
+
+    def _peers_or_error(self, ticker: str, info: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+        """
+        Look up a ticker's peers, reporting a failure as a single error entry so it
+        does not fail the caller.
+
+        Args:
+            ticker: The stock ticker symbol.
+            info: The ticker's info dict.
+            limit: Maximum number of peers to return.
+
+        Returns:
+            A list of dictionaries containing peer data, or a one-item error list.
+        """
+        try:
+            return self._peers_from_info(info, limit)
+        except Exception as e:
+            logger.error(f"Error fetching industry peers for {ticker}: {str(e)}", exc_info=True)
+            return [{"error": str(e), "ticker": ticker}]
+
+    @_ttl_cached
     def get_industry_peers(self, ticker: str, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Get industry peers for a ticker.
@@ -139,30 +505,10 @@ class YahooFinanceService:
         Returns:
             A list of dictionaries containing peer data.
         """
-        peers: List[Dict[str, Any]] = []
         try:
             logger.info(f"Getting industry peers for {ticker}")
-            stock = yf.Ticker(ticker)
-            info = stock.info
-
-            if info and "recommendedSymbols" in info:
-                recommended_symbols = info.get("recommendedSymbols", [])
-                peers_list = recommended_symbols[:limit]
-
-                for peer_ticker in peers_list:
-                    try:
-                        peer_stock = yf.Ticker(peer_ticker)
-                        peer_info = peer_stock.info
-                        peers.append({
-                            "ticker": peer_ticker,
-                            "name": peer_info.get("shortName"),
-                            "sector": peer_info.get("sector"),
-                            "industry": peer_info.get("industry"),
-                            "market_cap": peer_info.get("marketCap")
-                        })
-                    except Exception as peer_err:
-                        logger.warning(f"Error getting data for peer ticker {peer_ticker}: {peer_err}")
-            return self._sanitize_data(peers)
+            _, info = self._fetch_bundle(ticker)
+            return self._sanitize_data(self._peers_from_info(info, limit))
         except Exception as e:
             logger.error(f"Error fetching industry peers for {ticker}: {str(e)}", exc_info=True)
             return [{"error": str(e), "ticker": ticker}]
@@ -179,18 +525,39 @@ class YahooFinanceService:
         """
         try:
             logger.info(f"Fetching cash flow data for {ticker}")
-            stock = yf.Ticker(ticker)
+            stock = _ticker(ticker)
             cash_flow = stock.cashflow
 
             if cash_flow is None or cash_flow.empty:
                 return {"error": "Cash flow data is empty", "ticker": ticker}
 
-            cash_flow_dict = cash_flow.where(pd.notna(cash_flow), None).to_dict()
+            cash_flow_dict = cash_flow.where(cash_flow.notna(), None).to_dict()
             return self._sanitize_data(cash_flow_dict)
         except Exception as e:
             logger.error(f"Error fetching cash flow data for {ticker}: {str(e)}", exc_info=True)
             return {"error": str(e), "ticker": ticker}
 
+    @staticmethod
+    def _estimation_from_info(info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract the key financial metrics used for estimations from a ticker's info.
+        The values are scalars, so they are scrubbed directly and need no sanitizing pass.
+        """
+        return {key: _scrub_scalar(info.get(source)) for key, source in _ESTIMATION_KEYS}
+
+    @staticmethod
+    def _resource_from_info(info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract the resource-related fields from a ticker's info.
+        """
+        return {
+            "full_time_employees": info.get("fullTimeEmployees"),
+            "company_summary": info.get("longBusinessSummary"),
+            "industry": info.get("industry"),
+            "sector": info.get("sector")
+        }
+
+    @_ttl_cached
     def get_estimation_data(self, ticker: str) -> Dict[str, Any]:
         """
         Get key financial metrics for estimation purposes.
@@ -203,28 +570,13 @@ class YahooFinanceService:
         """
         try:
             logger.info(f"Fetching estimation data for {ticker}")
-            stock = yf.Ticker(ticker)
-            info = stock.info
-
-            estimation_data = {
-                "previous_close": info.get("previousClose"),
-                "open": info.get("open"),
-                "bid": info.get("bid"),
-                "ask": info.get("ask"),
-                "volume": info.get("volume"),
-                "market_cap": info.get("marketCap"),
-                "trailing_PE": info.get("trailingPE"),
-                "forward_PE": info.get("forwardPE"),
-                "price_to_book": info.get("priceToBook"),
-                "dividend_yield": info.get("dividendYield"),
-                "earnings_growth": info.get("earningsGrowth"),
-                "revenue_growth": info.get("revenueGrowth"),
-            }
-            return self._sanitize_data(estimation_data)
+            _, info = self._fetch_bundle(ticker)
+            return self._estimation_from_info(info)
         except Exception as e:
             logger.error(f"Error fetching estimation data for {ticker}: {str(e)}", exc_info=True)
             return {"error": str(e), "ticker": ticker}
 
+    @_ttl_cached
     def get_resource_allocation_data(self, ticker: str) -> Dict[str, Any]:
         """
         Get resource-related data for a ticker.
@@ -237,16 +589,8 @@ class YahooFinanceService:
         """
         try:
             logger.info(f"Fetching resource allocation data for {ticker}")
-            stock = yf.Ticker(ticker)
-            info = stock.info
-
-            resource_data = {
-                "full_time_employees": info.get("fullTimeEmployees"),
-                "company_summary": info.get("longBusinessSummary"),
-                "industry": info.get("industry"),
-                "sector": info.get("sector")
-            }
-            return self._sanitize_data(resource_data)
+            _, info = self._fetch_bundle(ticker)
+            return self._sanitize_data(self._resource_from_info(info))
         except Exception as e:
             logger.error(f"Error fetching resource allocation data for {ticker}: {str(e)}", exc_info=True)
             return {"error": str(e), "ticker": ticker}
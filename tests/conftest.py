@@ -0,0 +1,64 @@
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+# The finance engine modules import each other by flat module names (e.g. `base_agent`,
+# `prompts._common`, `agents.cash_flow`), so their directories go on the path the same
+# way the app runs them.
+ROOT = Path(__file__).resolve().parent.parent
+ENGINE = ROOT / "src" / "agentic" / "finance_engine"
+
+for path in (
+    ROOT / "archive",
+    ROOT / "src",
+    ROOT / "src" / "utils" / "tools_engine",
+    ENGINE,
+    ENGINE / "core",
+    ENGINE / "core" / "prompts",
+    ENGINE / "shared",
+):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+class FakeTicker:
+    """
+    Offline stand-in for yfinance.Ticker, with annual statements keyed by period date.
+    """
+
+    def __init__(self, symbol, info=None):
+        self.symbol = symbol
+        self.info = info if info is not None else {"shortName": symbol, "marketCap": 1_000}
+        periods = pd.to_datetime(["2024-06-30", "2023-06-30"])
+        self.income_stmt = pd.DataFrame(
+            [[245.1, 211.9], [float("nan"), 72.4]], index=["Total Revenue", "Net Income"], columns=periods
+        )
+        self.balance_sheet = pd.DataFrame([[512.2, float("inf")]], index=["Total Assets"], columns=periods)
+        self.cashflow = pd.DataFrame([[118.5, 87.6]], index=["Free Cash Flow"], columns=periods)
+
+
+@pytest.fixture
+def yahoo_infos():
+    """
+    Ticker info served by FakeTicker, by symbol; symbols not listed get a default info.
+    """
+    return {}
+
+
+@pytest.fixture
+def yahoo(monkeypatch, yahoo_infos):
+    """
+    The Yahoo Finance server module with Tickers served by FakeTicker and an empty
+    result cache.
+    """
+    import yahoo_finance_server
+
+    yahoo_finance_server._yf()
+    monkeypatch.setattr(
+        yahoo_finance_server, "_ticker", lambda symbol: FakeTicker(symbol, yahoo_infos.get(symbol))
+    )
+    monkeypatch.setattr(yahoo_finance_server, "_cache", OrderedDict())
+    return yahoo_finance_server
@@ -0,0 +1,163 @@
+import asyncio
+
+import pytest
+
+from agents.cash_flow import CashFlowAgent, generate_cash_flow, generate_cash_flow_async
+from agents.cost_estimations import EstimationsAgent, generate_estimations, generate_estimations_async
+from agents.resource_planning import (
+    ResourcePlanningAgent,
+    generate_resource_plan,
+    generate_resource_plan_async,
+    generate_resource_plan_batch,
+)
+from agents.revenue_modeling import (
+    RevenueModelingAgent,
+    generate_revenue_models,
+    generate_revenue_models_async,
+    generate_revenue_models_batch,
+)
+from base_agent import BaseAgent
+
+
+class StubExecutor:
+    """
+    Stands in for the AgentExecutor: echoes the agent name and records every input.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.inputs = []
+
+    def invoke(self, payload):
+        self.inputs.append(payload["input"])
+        return {"output": f"{self.name} output"}
+
+    async def ainvoke(self, payload):
+        return self.invoke(payload)
+
+    def batch(self, payloads, config=None, return_exceptions=False):
+        return [self.invoke(payload) for payload in payloads]
+
+
+@pytest.fixture
+def stub_agents(monkeypatch):
+    """
+    Install a pooled instance of every agent whose executor is a StubExecutor, so the
+    module-level wrappers run end to end without an LLM.
+    """
+    executors = {}
+    for agent_class in (CashFlowAgent, EstimationsAgent, ResourcePlanningAgent, RevenueModelingAgent):
+        agent = agent_class.__new__(agent_class)
+        agent.streaming = False
+        agent.agent_executor = executors[agent_class] = StubExecutor(agent_class.__name__)
+        monkeypatch.setitem(BaseAgent._instances, (agent_class, False), agent)
+    BaseAgent.response_cache.clear()
+    yield executors
+    BaseAgent.response_cache.clear()
+
+
+@pytest.mark.parametrize("wrapper, args, agent_class", [
+    (generate_cash_flow, ("EcoTech", "Smart home system"), CashFlowAgent),
+    (generate_estimations, ("EcoTech", "2024-05-01"), EstimationsAgent),
+    (generate_resource_plan, ("EcoTech",), ResourcePlanningAgent),
+    (generate_revenue_models, ("EcoTech",), RevenueModelingAgent),
+])
+def test_sync_wrappers_run_their_agent(stub_agents, wrapper, args, agent_class):
+    result = wrapper(*args, additional_context="Budget: $1M")
+
+    assert result == {
+        "project_name": "EcoTech",
+        "output": f"{agent_class.__name__} output",
+        "success": True,
+        "intermediate_steps": None,
+    }
+    assert "EcoTech" in stub_agents[agent_class].inputs[0]
+
+
+@pytest.mark.parametrize("wrapper, args, agent_class", [
+    (generate_cash_flow_async, ("EcoTech", "Smart home system"), CashFlowAgent),
+    (generate_estimations_async, ("EcoTech", "2024-05-01"), EstimationsAgent),
+    (generate_resource_plan_async, ("EcoTech",), ResourcePlanningAgent),
+    (generate_revenue_models_async, ("EcoTech",), RevenueModelingAgent),
+])
+def test_async_wrappers_run_their_agent(stub_agents, wrapper, args, agent_class):
+    result = asyncio.run(wrapper(*args, additional_context="Budget: $1M"))
+
+    assert result["success"] is True
+    assert result["output"] == f"{agent_class.__name__} output"
+    assert len(stub_agents[agent_class].inputs) == 1
+
+
+@pytest.mark.parametrize("wrapper, agent_class", [
+    (generate_resource_plan_batch, ResourcePlanningAgent),
+    (generate_revenue_models_batch, RevenueModelingAgent),
+])
+def test_batch_wrappers_run_their_agent(stub_agents, wrapper, agent_class):
+    results = wrapper([{"project_name": "EcoTech"}, {"project_name": "SolarGrid", "additional_context": "EU"}])
+
+    assert [result["project_name"] for result in results] == ["EcoTech", "SolarGrid"]
+    assert all(result["success"] for result in results)
+    assert len(stub_agents[agent_class].inputs) == 2
+
+
+def test_financial_analysis_gathers_all_three_agents(stub_agents):
+    from agents.financial_analysis import generate_financial_analysis
+
+    result = asyncio.run(generate_financial_analysis("EcoTech", "Smart home system", "Budget: $1M"))
+
+    assert result == {
+        "project_name": "EcoTech",
+        "success": True,
+        "team_structure": "ResourcePlanningAgent output",
+        "cash_flow_projection": "CashFlowAgent output",
+        "income_statement": "RevenueModelingAgent output",
+        "error": None,
+    }
+
+
+def test_financial_analysis_joins_agent_errors(stub_agents):
+    from agents.financial_analysis import generate_financial_analysis
+
+    def fail(payload):
+        raise RuntimeError("rate limited")
+
+    stub_agents[RevenueModelingAgent].invoke = fail
+    result = asyncio.run(generate_financial_analysis("EcoTech", "Smart home system"))
+
+    assert result["success"] is False
+    assert result["cash_flow_projection"] == "CashFlowAgent output"
+    assert result["error"] == "rate limited"
+
+
+def test_project_bundle_gathers_all_three_agents(stub_agents):
+    from agents.financial_analysis import generate_project_bundle
+
+    bundle = asyncio.run(generate_project_bundle("EcoTech", "2024-05-01"))
+
+    assert {name: result["output"] for name, result in bundle.items()} == {
+        "estimations": "EstimationsAgent output",
+        "resource_plan": "ResourcePlanningAgent output",
+        "revenue_models": "RevenueModelingAgent output",
+    }
+
+
+def test_batch_reports_malformed_inputs_per_project(stub_agents):
+    results = ResourcePlanningAgent.shared().run_batch([
+        {"project_name": "EcoTech", "project_description": ""},
+        {"project_name": "SolarGrid", "project_description": "", "industry": "Energy"},
+    ])
+
+    assert results[0]["success"] is True
+    assert results[1]["success"] is False
+    assert "industry" in results[1]["error"]
+    assert len(stub_agents[ResourcePlanningAgent].inputs) == 1
+
+
+def test_batch_uses_response_cache(stub_agents):
+    generate_revenue_models("EcoTech")
+    results = generate_revenue_models_batch([{"project_name": "EcoTech"}, {"project_name": "SolarGrid"}])
+
+    assert [result["project_name"] for result in results] == ["EcoTech", "SolarGrid"]
+    assert len(stub_agents[RevenueModelingAgent].inputs) == 2
+    assert generate_revenue_models_batch([{"project_name": "SolarGrid"}])[0]["success"] is True
+    assert len(stub_agents[RevenueModelingAgent].inputs) == 2
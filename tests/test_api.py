@@ -0,0 +1,81 @@
+import importlib.util
+
+import pytest
+from fastapi.testclient import TestClient
+
+from conftest import ENGINE
+
+
+@pytest.fixture(scope="module")
+def api():
+    # Loaded by path: several services in this repo have a top-level `main.py`.
+    spec = importlib.util.spec_from_file_location("finance_engine_main", ENGINE / "main.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def client(api):
+    with TestClient(api.app) as test_client:
+        yield test_client
+
+
+REQUEST = {
+    "project_name": "EcoTech",
+    "project_description": "Smart home system",
+    "additional_context": {"industry": "Consumer Electronics", "market_size": "$50 billion"},
+}
+
+
+def test_health(client):
+    assert client.get("/health").json() == {"status": "healthy", "service": "Financial Agents API"}
+
+
+def test_cash_flow_returns_agent_output(api, client, monkeypatch):
+    calls = []
+
+    async def fake_generate(project_name, project_description, additional_context):
+        calls.append(additional_context)
+        return {"project_name": project_name, "output": "projection", "success": True, "intermediate_steps": None}
+
+    monkeypatch.setattr(api, "generate_cash_flow_async", fake_generate)
+    response = client.post("/cash-flow", json=REQUEST)
+
+    assert response.status_code == 200
+    assert response.json() == {"project_name": "EcoTech", "success": True, "cash_flow_projection": "projection"}
+    assert calls[0].industry == "Consumer Electronics"
+
+
+def test_financial_analysis_reports_agent_errors(api, client, monkeypatch):
+    async def fake_analysis(project_name, project_description, additional_context):
+        return {
+            "project_name": project_name,
+            "success": False,
+            "team_structure": None,
+            "cash_flow_projection": "projection",
+            "income_statement": None,
+            "error": "resource planning failed",
+        }
+
+    monkeypatch.setattr(api, "generate_financial_analysis", fake_analysis)
+    response = client.post("/financial-analysis", json=REQUEST)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "project_name": "EcoTech",
+        "success": False,
+        "cash_flow_projection": "projection",
+        "error": "resource planning failed",
+    }
+
+
+
+def test_cash_flow_ignores_unknown_fields(api, client, monkeypatch):
+    async def fake_generate(project_name, project_description, additional_context):
+        return {"project_name": project_name, "output": "projection", "success": True, "intermediate_steps": None}
+
+    monkeypatch.setattr(api, "generate_cash_flow_async", fake_generate)
+    response = client.post("/cash-flow", json={**REQUEST, "client_version": "2.1"})
+
+    assert response.status_code == 200
@@ -0,0 +1,25 @@
+import asyncio
+
+from base_agent import BaseAgent
+
+
+class FailingAgent(BaseAgent):
+    """
+    Agent whose input formatting fails, built without an LLM.
+    """
+
+    def __init__(self):
+        self.streaming = True
+
+    def get_system_prompt(self):
+        return "system"
+
+    def _format_input(self, project_name, project_description, additional_context=None):
+        raise TypeError("bad context")
+
+
+def test_stream_reports_input_errors_as_events():
+    async def collect():
+        return [event async for event in FailingAgent().astream("EcoTech", "Smart home system")]
+
+    assert asyncio.run(collect()) == [{"type": "error", "project_name": "EcoTech", "error": "bad context"}]
@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from calculations.cash_flow_calculations import (
+    apply_discount_rate,
+    compute_cumulative_discounted_cash_flow,
+    compute_cumulative_flow,
+    compute_net_cash_flow,
+    generate_cash_flow_statement,
+)
+from calculations.estimations_calculations import generate_estimation_summary
+
+
+# Plain-loop references matching the original list-based implementations.
+def reference_net(inflows, outflows):
+    return [inflow - outflow for inflow, outflow in zip(inflows, outflows)]
+
+
+def reference_cumulative(flows):
+    cumulative, total = [], 0.0
+    for flow in flows:
+        total += flow
+        cumulative.append(total)
+    return cumulative
+
+
+def reference_discount(cash_flows, discount_rate, periods=None):
+    if periods is None:
+        periods = range(1, len(cash_flows) + 1)
+    return [cf / ((1 + discount_rate) ** period) for cf, period in zip(cash_flows, periods)]
+
+
+rng = np.random.default_rng(7)
+INFLOWS = rng.uniform(0, 50_000, 36).tolist()
+OUTFLOWS = rng.uniform(0, 50_000, 36).tolist()
+NET = reference_net(INFLOWS, OUTFLOWS)
+CUSTOM_PERIODS = [1, 2, 4, 7, 12, 24]
+
+
+def test_net_and_cumulative_flows_match_loops():
+    np.testing.assert_allclose(compute_net_cash_flow(INFLOWS, OUTFLOWS), NET, rtol=1e-12)
+    np.testing.assert_allclose(compute_cumulative_flow(NET), reference_cumulative(NET), rtol=1e-9)
+    np.testing.assert_allclose(
+        compute_cumulative_discounted_cash_flow(NET), reference_cumulative(NET), rtol=1e-9
+    )
+
+
+@pytest.mark.parametrize("discount_rate", [0.0, 0.08 / 12, 0.25])
+def test_discounting_matches_loop(discount_rate):
+    np.testing.assert_allclose(
+        apply_discount_rate(NET, discount_rate), reference_discount(NET, discount_rate), rtol=1e-12
+    )
+    flows = NET[: len(CUSTOM_PERIODS)]
+    np.testing.assert_allclose(
+        apply_discount_rate(flows, discount_rate, CUSTOM_PERIODS),
+        reference_discount(flows, discount_rate, CUSTOM_PERIODS),
+        rtol=1e-12,
+    )
+
+
+@pytest.mark.parametrize("periods", [None, CUSTOM_PERIODS])
+def test_cash_flow_statement_matches_loops(periods):
+    count = len(periods) if periods else len(INFLOWS)
+    inflows, outflows, discount_rate = INFLOWS[:count], OUTFLOWS[:count], 0.1 / 12
+    net = reference_net(inflows, outflows)
+    discounted = reference_discount(net, discount_rate, periods)
+
+    statement = generate_cash_flow_statement(inflows, outflows, discount_rate, periods).to_dict()
+
+    np.testing.assert_allclose(statement["net_cash_flow"], net, rtol=1e-12)
+    np.testing.assert_allclose(statement["cumulative_cash_flow"], reference_cumulative(net), rtol=1e-9)
+    np.testing.assert_allclose(statement["discounted_cash_flow"], discounted, rtol=1e-12)
+    np.testing.assert_allclose(
+        statement["cumulative_discounted_cash_flow"], reference_cumulative(discounted), rtol=1e-9
+    )
+
+
+def test_cash_flow_statement_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        generate_cash_flow_statement([1.0, 2.0], [1.0], 0.01)
+    with pytest.raises(ValueError):
+        generate_cash_flow_statement([1.0, 2.0], [1.0, 1.0], 0.01, periods=[1])
+
+
+def test_estimation_summary_matches_loop():
+    items = [
+        {"description": "Developers", "quantity": 3, "unit_price": "8500.50"},
+        {"description": "Licenses", "quantity": 12.5, "unit_price": 99.99},
+        {"quantity": 2},
+    ]
+
+    summary = generate_estimation_summary(items, tax_rate=0.07)
+
+    expected = [
+        (item.get("description", ""), float(item.get("quantity", 0)), float(item.get("unit_price", 0)))
+        for item in items
+    ]
+    assert [
+        (line["description"], line["quantity"], line["unit_price"], line["line_subtotal"])
+        for line in summary["line_items"]
+    ] == [(description, qty, up, qty * up) for description, qty, up in expected]
+    subtotal = sum(qty * up for _, qty, up in expected)
+    assert summary["subtotal"] == pytest.approx(subtotal, rel=1e-12)
+    assert summary["tax"] == pytest.approx(subtotal * 0.07, rel=1e-12)
+    assert summary["grand_total"] == pytest.approx(subtotal * 1.07, rel=1e-12)
+
+
+def test_estimation_summary_handles_no_items():
+    assert generate_estimation_summary([]) == {
+        "line_items": [], "subtotal": 0.0, "tax": 0.0, "grand_total": 0.0
+    }
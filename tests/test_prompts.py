@@ -0,0 +1,52 @@
+from base_scheme import AdditionalContext
+from prompts._common import context_to_str, render_template, split_template
+from prompts.prompt_cash_flow import build_cash_flow_prompt
+from prompts.prompt_cost_estimations import build_estimations_prompt
+from prompts.prompt_resource_planning import get_resource_planning_prompt
+from prompts.prompt_revenue_modeling import get_revenue_modeling_prompt
+
+
+def _context(**fields) -> AdditionalContext:
+    return AdditionalContext(industry="Consumer Electronics", **fields)
+
+
+def test_context_to_str_is_canonical():
+    first = _context(market_size="$50 billion", timeframe="24 months")
+    second = AdditionalContext(timeframe="24 months", industry="Consumer Electronics", market_size="$50 billion")
+    assert context_to_str(first) == context_to_str(second)
+    assert context_to_str(first) == (
+        '{"industry":"Consumer Electronics","market_size":"$50 billion","timeframe":"24 months"}'
+    )
+
+
+def test_context_to_str_passes_text_and_empty_through():
+    assert context_to_str("Focus on EU markets") == "Focus on EU markets"
+    assert context_to_str(None) == ""
+    assert context_to_str("") == ""
+    assert context_to_str({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+
+
+def test_builders_accept_structured_context():
+    context = _context(project_scale="Medium")
+    prompts = (
+        build_cash_flow_prompt("EcoTech", "Smart home system", context),
+        build_estimations_prompt("EcoTech", "Acme", "1 Main St", "2024-01-01", "2024-02-01", context),
+        get_resource_planning_prompt("EcoTech", context),
+        get_revenue_modeling_prompt("EcoTech", context),
+    )
+    for prompt in prompts:
+        assert 'Additional Context: {"industry":"Consumer Electronics","project_scale":"Medium"}' in prompt
+
+
+def test_builders_omit_empty_context_line():
+    assert "Additional Context" not in build_cash_flow_prompt("EcoTech", "Smart home system")
+    assert "Additional Context" not in get_revenue_modeling_prompt("EcoTech", "")
+    assert build_cash_flow_prompt("EcoTech", "Smart home system", "Be brief").endswith(
+        "Additional Context: Be brief"
+    )
+
+
+def test_render_template_matches_str_format():
+    template = "Project: {name}\nBudget: {budget}\nNotes: {notes}"
+    values = {"name": "EcoTech", "budget": 750000, "notes": None}
+    assert render_template(split_template(template), values) == template.format(**values)
@@ -0,0 +1,45 @@
+from response_cache import ResponseCache
+
+
+def test_key_collapses_whitespace_only():
+    key = ResponseCache.make_key("CashFlowAgent", "system", False, "Project  'EcoTech'\n budget $1M")
+    assert key == ResponseCache.make_key("CashFlowAgent", "system", False, "Project 'EcoTech' budget $1M")
+    assert key != ResponseCache.make_key("CashFlowAgent", "system", False, "project 'ecotech' budget $1m")
+
+
+def test_key_is_scoped_by_streaming_flag():
+    assert ResponseCache.make_key("CashFlowAgent", "system", False, "prompt") != (
+        ResponseCache.make_key("CashFlowAgent", "system", True, "prompt")
+    )
+
+
+def test_get_returns_copies_and_evicts_least_recent():
+    cache = ResponseCache(maxsize=2)
+    cache.set("a", {"output": "A"})
+    cache.set("b", {"output": "B"})
+    cache.get("a")["output"] = "changed"
+    cache.set("c", {"output": "C"})
+
+    assert cache.get("a") == {"output": "A"}
+    assert cache.get("b") is None
+    assert cache.get("c") == {"output": "C"}
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    import response_cache
+
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    cache = ResponseCache(maxsize=2, ttl_seconds=60)
+    cache.set("a", {"output": "A"})
+
+    now[0] += 59
+    assert cache.get("a") == {"output": "A"}
+    now[0] += 1
+    assert cache.get("a") is None
+
+
+def test_zero_ttl_disables_cache():
+    cache = ResponseCache(maxsize=2, ttl_seconds=0)
+    cache.set("a", {"output": "A"})
+    assert cache.get("a") is None
@@ -0,0 +1,55 @@
+import importlib.util
+import sys
+from collections import OrderedDict
+
+import pytest
+from fastapi.testclient import TestClient
+
+from conftest import ROOT
+
+
+@pytest.fixture
+def tools_api(monkeypatch, yahoo):
+    # Deployed next to the service as `finance_service`; here the service module is
+    # registered under that name and the app is loaded by path.
+    monkeypatch.setitem(sys.modules, "finance_service", yahoo)
+    spec = importlib.util.spec_from_file_location(
+        "tools_engine_main", ROOT / "src" / "utils" / "tools_engine" / "common" / "main.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "_serialized", OrderedDict())
+    return module
+
+
+def test_financials_serialize_timestamp_columns(tools_api):
+    with TestClient(tools_api.app) as client:
+        response = client.get("/yahoo_market_financials/MSFT")
+
+    assert response.status_code == 200
+    assert response.json()["income_statement"] == {
+        "2024-06-30T00:00:00": {"Total Revenue": 245.1, "Net Income": None},
+        "2023-06-30T00:00:00": {"Total Revenue": 211.9, "Net Income": 72.4},
+    }
+    assert response.json()["balance_sheet"]["2023-06-30T00:00:00"] == {"Total Assets": None}
+
+
+def test_new_result_is_never_served_a_stale_body(tools_api):
+    # Error results are not cached upstream, so the next result is a different object
+    # even if it lands at the same address.
+    assert tools_api._json_response(("market", "MSFT"), {"error": "timeout"}).body == b'{"error":"timeout"}'
+    assert tools_api._json_response(("market", "MSFT"), {"price": 1.0}).body == b'{"price":1.0}'
+
+
+def test_serialized_bodies_are_reused_for_the_same_result(tools_api):
+    result = {"price": 1.0}
+    first = tools_api._json_response(("market", "MSFT"), result).body
+    result["price"] = 2.0
+    assert tools_api._json_response(("market", "MSFT"), result).body is first
+
+
+def test_expired_bodies_release_their_results(tools_api, monkeypatch):
+    monkeypatch.setattr(tools_api, "_SERIALIZED_TTL_SECONDS", 0.0)
+    tools_api._json_response(("market", "AAPL"), {"price": 3.0})
+    tools_api._json_response(("peers", "AAPL", 5), [])
+    assert list(tools_api._serialized) == [("peers", "AAPL", 5)]
@@ -0,0 +1,89 @@
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+def test_market_data_bundles_every_part(yahoo, yahoo_infos):
+    yahoo_infos["MSFT"] = {"shortName": "Microsoft", "recommendedSymbols": ["AAPL", "GOOG"]}
+    service = yahoo.YahooFinanceService()
+
+    result = service.get_all_market_data("MSFT")
+
+    assert result["info"]["shortName"] == "Microsoft"
+    assert [peer["ticker"] for peer in result["peers"]] == ["AAPL", "GOOG"]
+    assert result["financials"]["cash_flow"]["2024-06-30T00:00:00"] == {"Free Cash Flow": 118.5}
+    assert service.get_all_market_data("MSFT") is result
+
+
+def test_market_data_contains_peer_failures(yahoo, yahoo_infos):
+    # A malformed recommendation list makes the peer lookup raise.
+    yahoo_infos["MSFT"] = {"shortName": "Microsoft", "recommendedSymbols": None}
+    service = yahoo.YahooFinanceService()
+
+    result = service.get_all_market_data("MSFT")
+
+    assert "error" not in result
+    assert result["info"]["shortName"] == "Microsoft"
+    assert result["financials"]["income_statement"]
+    assert [peer["ticker"] for peer in result["peers"]] == ["MSFT"]
+    assert "error" in result["peers"][0]
+    # A bundle with a failed part is not cached.
+    assert service.get_all_market_data("MSFT") is not result
+
+
+def test_ttl_cache_shares_concurrent_misses(yahoo):
+    release = threading.Event()
+    calls = []
+
+    class Service:
+        @yahoo._ttl_cached
+        def lookup(self, ticker):
+            calls.append(ticker)
+            release.wait(5)
+            return {"ticker": ticker}
+
+    service = Service()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(service.lookup, "MSFT") for _ in range(4)]
+        time.sleep(0.1)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert calls == ["MSFT"]
+    assert all(result is results[0] for result in results)
+
+
+def test_ttl_cache_skips_errors_and_expires(yahoo, monkeypatch):
+    calls = []
+
+    class Service:
+        @yahoo._ttl_cached
+        def lookup(self, ticker):
+            calls.append(ticker)
+            return {"error": "timeout"} if len(calls) == 1 else {"ticker": ticker}
+
+    service = Service()
+    assert service.lookup("MSFT") == {"error": "timeout"}
+    assert service.lookup("MSFT") == {"ticker": "MSFT"}
+    assert service.lookup("MSFT") == {"ticker": "MSFT"}
+    assert len(calls) == 2
+
+    monkeypatch.setattr(yahoo, "_CACHE_TTL_SECONDS", 0.0)
+    service.lookup("AAPL")
+    service.lookup("AAPL")
+    assert calls[2:] == ["AAPL", "AAPL"]
+
+
+def test_sanitize_copies_only_what_changes(yahoo):
+    clean = {"name": "Microsoft", "officers": [{"age": 60}], "beta": 0.9}
+    assert yahoo._sanitize(clean) is clean
+
+    data = {"name": "Microsoft", "ratios": [1.5, float("nan")], "beta": np.float64("inf")}
+    sanitized = yahoo._sanitize(data)
+
+    assert sanitized == {"name": "Microsoft", "ratios": [1.5, None], "beta": None}
+    assert math.isnan(data["ratios"][1])
+    assert yahoo._sanitize(np.array([1.0, np.inf])) == [1.0, None]